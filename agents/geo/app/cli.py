@@ -7,7 +7,7 @@ from typing import Optional
 import psycopg
 import typer
 
-from .config import AppSettings
+from .config import get_settings
 from .logging import configure_logging, get_logger
 from .shapes import refresh_regions
 
@@ -37,15 +37,20 @@ def load_shapes(
 ) -> None:
     """Refresh the regions table using the provided shapefile source."""
 
-    settings = AppSettings()
-    shapes_source = source or settings.shapes_source
+    # Settings are only consulted for values not given on the command line.
+    shapes_source = source
+    if not shapes_source:
+        try:
+            shapes_source = get_settings().resolve_shapes_source()
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--source") from exc
     if not shapes_source:
         raise typer.BadParameter(
             "No shapes source provided. Specify --source or configure GEO_SHAPES_SOURCE.",
             param_hint="--source",
         )
 
-    dsn = database_dsn or settings.database_dsn
+    dsn = database_dsn or get_settings().database_dsn
     if not dsn:
         raise typer.BadParameter(
             "No database DSN provided. Specify --database-dsn or configure GEO_DATABASE_DSN.",
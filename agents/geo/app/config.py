@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AppSettings(BaseSettings):
     """Settings for the geo agent."""
 
-    database_dsn: str
+    database_dsn: Optional[str] = None
     shapes_source: Optional[str] = None
 
     model_config = SettingsConfigDict(env_prefix="GEO_", env_file=".env", env_file_encoding="utf-8")
 
-    @field_validator("shapes_source")
-    @classmethod
-    def _validate_source(cls, value: Optional[str]) -> Optional[str]:
+    def resolve_shapes_source(self) -> Optional[str]:
+        """Return the configured shapes source, checking that local paths exist.
+
+        The check runs on demand rather than as a field validator so that callers
+        overriding the source (e.g. ``--source``) never pay for the filesystem lookup.
+        """
+
+        value = self.shapes_source
         if value is None:
             return value
         # Allow URLs and local paths
@@ -29,3 +34,10 @@ class AppSettings(BaseSettings):
         if not path.exists():
             raise ValueError(f"Configured shapes source does not exist: {value}")
         return str(path)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the process-wide settings, reading the environment and ``.env`` once."""
+
+    return AppSettings()
@@ -3,27 +3,36 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Optional
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 _LOGGING_CONFIGURED = False
+_PLAIN_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 
 
 def configure_logging(level: str | int = "INFO") -> None:
-    """Configure logging for the geo agent."""
+    """Configure logging for the geo agent.
+
+    Rich output is only used on an interactive terminal; batch runs (CI, containers,
+    redirected stderr) get a plain ``StreamHandler``, which is much cheaper per record.
+    """
 
     global _LOGGING_CONFIGURED
     if _LOGGING_CONFIGURED:
         return
 
-    logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(console=Console(stderr=True), rich_tracebacks=True)],
-    )
+    handler: logging.Handler
+    if sys.stderr.isatty():
+        handler = RichHandler(console=Console(stderr=True), rich_tracebacks=True)
+        handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(_PLAIN_FORMAT))
+
+    logging.basicConfig(level=level, handlers=[handler])
     _LOGGING_CONFIGURED = True
 
 
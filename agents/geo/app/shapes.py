@@ -2,28 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import tempfile
 import zipfile
-from dataclasses import dataclass
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import psycopg
 import requests
+import shapely
 from psycopg import sql
-from shapely.geometry import GeometryCollection, MultiPolygon, Polygon, mapping
+from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
 
 TARGET_CRS = "EPSG:4326"
-
-
-@dataclass
-class RegionRecord:
-    """Structured representation of a region ready for database insertion."""
-
-    code: str
-    name: str
-    geometry: MultiPolygon
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def load_subject_shapes(source: str) -> gpd.GeoDataFrame:
@@ -37,7 +29,7 @@ def load_subject_shapes(source: str) -> gpd.GeoDataFrame:
     gdf = _read_geodataframe(path)
     gdf = _normalise_columns(gdf)
     gdf = _ensure_crs(gdf, TARGET_CRS)
-    gdf["geometry"] = gdf["geometry"].apply(_ensure_multipolygon)
+    gdf["geometry"] = _ensure_multipolygons(gdf.geometry)
     return gdf
 
 
@@ -45,45 +37,64 @@ def refresh_regions(conn: psycopg.Connection, source: str) -> int:
     """Refresh the `regions` table using shapes from ``source``.
 
     The operation runs inside a single transaction, truncating the table before inserting
-    rows. Geometries are stored using ``ST_Multi(ST_GeomFromGeoJSON(...))`` ensuring a
-    4326 SRID.
+    rows. Geometries are encoded to WKB in one vectorised call, streamed into a temporary
+    staging table with binary ``COPY`` and moved into `regions` by a single
+    ``INSERT ... SELECT`` using ``ST_Multi(ST_GeomFromWKB(..., 4326))`` ensuring a 4326
+    SRID. When the source repeats a code, the last shape wins.
     """
 
     gdf = load_subject_shapes(source)
-    records = [RegionRecord(row.code, row.name, row.geometry) for row in gdf.itertuples()]
+    gdf = gdf.drop_duplicates(subset="code", keep="last")
+    codes = gdf["code"].astype(str)
+    names = gdf["name"].astype(str)
+    wkbs = shapely.to_wkb(gdf.geometry.values)
 
     with conn.transaction():
         with conn.cursor() as cur:
             cur.execute("TRUNCATE TABLE regions RESTART IDENTITY")
-            insert_stmt = sql.SQL(
+            cur.execute(
                 """
-                INSERT INTO regions (code, name, boundary)
-                VALUES (%s, %s, ST_SetSRID(ST_Multi(ST_GeomFromGeoJSON(%s)), 4326))
-                ON CONFLICT (code)
-                DO UPDATE SET
-                    name = EXCLUDED.name,
-                    boundary = EXCLUDED.boundary
+                CREATE TEMP TABLE _regions_stage (
+                    code TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    wkb BYTEA NOT NULL
+                ) ON COMMIT DROP
                 """
             )
+            copy_stmt = "COPY _regions_stage (code, name, wkb) FROM STDIN (FORMAT BINARY)"
+            with cur.copy(copy_stmt) as copy:
+                copy.set_types(["text", "text", "bytea"])
+                for row in zip(codes, names, wkbs):
+                    copy.write_row(row)
+
+            cur.execute(
+                sql.SQL(
+                    """
+                    INSERT INTO regions (code, name, boundary)
+                    SELECT code, name, ST_Multi(ST_GeomFromWKB(wkb, 4326))
+                    FROM _regions_stage
+                    ON CONFLICT (code)
+                    DO UPDATE SET
+                        name = EXCLUDED.name,
+                        boundary = EXCLUDED.boundary
+                    """
+                )
+            )
 
-            for record in records:
-                geojson = json.dumps(mapping(record.geometry))
-                cur.execute(insert_stmt, (record.code, record.name, geojson))
-
-    return len(records)
+    return len(wkbs)
 
 
 def _materialize_source(source: str) -> Path:
     """Download or resolve the source path for the shapefile."""
 
     if source.startswith("http://") or source.startswith("https://"):
-        response = requests.get(source, timeout=60)
-        response.raise_for_status()
         suffix = Path(source).suffix or ".zip"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(response.content)
-            tmp.flush()
-            return Path(tmp.name)
+        with requests.get(source, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    tmp.write(chunk)
+                return Path(tmp.name)
 
     return Path(source)
 
@@ -92,13 +103,13 @@ def _read_geodataframe(path: Path) -> gpd.GeoDataFrame:
     """Read a shapefile from ``path`` into a GeoDataFrame."""
 
     if path.suffix == ".zip":
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with zipfile.ZipFile(path) as zf:
-                zf.extractall(tmpdir)
-            shapefiles = list(Path(tmpdir).glob("*.shp"))
-            if not shapefiles:
-                raise FileNotFoundError("No shapefile found in archive")
-            return gpd.read_file(shapefiles[0], engine="pyogrio")
+        # Read straight from the archive through GDAL's virtual filesystem; only the
+        # central directory is scanned here, nothing is extracted to disk.
+        with zipfile.ZipFile(path) as zf:
+            shapefiles = [name for name in zf.namelist() if name.lower().endswith(".shp")]
+        if not shapefiles:
+            raise FileNotFoundError("No shapefile found in archive")
+        return gpd.read_file(f"/vsizip/{path.resolve()}/{shapefiles[0]}", engine="pyogrio")
 
     if path.is_dir():
         shapefiles = list(path.glob("*.shp"))
@@ -128,15 +139,37 @@ def _ensure_crs(gdf: gpd.GeoDataFrame, target: str) -> gpd.GeoDataFrame:
     """Reproject the GeoDataFrame to the target CRS if necessary."""
 
     if gdf.crs is None:
-        gdf = gdf.set_crs(target)
-        return gdf
+        return gdf.set_crs(target)
 
-    if str(gdf.crs).upper() in {target, "EPSG:4326"}:
-        return gdf.to_crs(target)
+    if gdf.crs == target:
+        return gdf
 
     return gdf.to_crs(target)
 
 
+def _ensure_multipolygons(geometries: gpd.GeoSeries) -> gpd.GeoSeries:
+    """Convert a series of polygonal geometries into MultiPolygons.
+
+    Polygons are wrapped with a single vectorised shapely call and MultiPolygons are kept
+    as-is; only the remaining (rare) geometry types go through ``_ensure_multipolygon``.
+    """
+
+    values = np.asarray(geometries.values, dtype=object).copy()
+    type_ids = shapely.get_type_id(values)
+
+    polygons = type_ids == shapely.GeometryType.POLYGON
+    if polygons.any():
+        values[polygons] = shapely.multipolygons(
+            values[polygons], indices=np.arange(int(polygons.sum()))
+        )
+
+    others = ~polygons & (type_ids != shapely.GeometryType.MULTIPOLYGON)
+    for position in np.flatnonzero(others):
+        values[position] = _ensure_multipolygon(values[position])
+
+    return gpd.GeoSeries(values, index=geometries.index, crs=geometries.crs, name=geometries.name)
+
+
 def _ensure_multipolygon(geometry) -> MultiPolygon:
     """Convert any polygonal geometry into a MultiPolygon."""
 
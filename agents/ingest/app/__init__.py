@@ -1,7 +1,7 @@
 """Ingest agent application package."""
 
-from .config import AppSettings, MinioSettings, PostgresSettings, StorageSettings
-from .formats import detect_format, load_records
+from .config import AppSettings, MinioSettings, PostgresSettings, StorageSettings, get_settings
+from .formats import detect_format, load_records, load_records_many
 from .logging import configure_logging, get_logger
 from .normalization import normalize_records
 from .pipeline import IngestPipeline
@@ -11,9 +11,11 @@ __all__ = [
     "MinioSettings",
     "PostgresSettings",
     "StorageSettings",
+    "get_settings",
     "IngestPipeline",
     "detect_format",
     "load_records",
+    "load_records_many",
     "normalize_records",
     "configure_logging",
     "get_logger",
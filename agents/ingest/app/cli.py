@@ -7,7 +7,7 @@ from typing import Optional
 
 import typer
 
-from .config import AppSettings
+from .config import get_settings
 from .logging import configure_logging, get_logger
 from .pipeline import IngestPipeline
 
@@ -55,8 +55,7 @@ def ingest(
 ) -> None:
     """Execute the ingest pipeline with the provided parameters."""
 
-    settings = AppSettings()
-    pipeline = IngestPipeline(settings=settings)
+    settings = get_settings()
     logger = get_logger("app.cli")
 
     context = {
@@ -69,14 +68,16 @@ def ingest(
     }
     logger.info("Starting ingest command", extra={"context": context})
 
-    pipeline.run(
-        source,
-        year=year,
-        fmt=fmt,
-        storage_path=storage_path,
-        dry_run=dry_run,
-        dataset_version=dataset_version,
-    )
+    # closing the pipeline releases its connection pool and upload threads before exit
+    with IngestPipeline(settings=settings) as pipeline:
+        pipeline.run(
+            source,
+            year=year,
+            fmt=fmt,
+            storage_path=storage_path,
+            dry_run=dry_run,
+            dataset_version=dataset_version,
+        )
 
     logger.info("Finished ingest command", extra={"context": context})
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -84,3 +85,13 @@ class AppSettings(BaseSettings):
         """Return the default dataset version if defined."""
 
         return self.storage.dataset_version
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the process-wide settings, parsing the environment only once.
+
+    Call ``get_settings.cache_clear()`` after changing the environment (e.g. in tests).
+    """
+
+    return AppSettings()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
-from dataclasses import dataclass
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional
 
@@ -18,11 +22,7 @@ class FormatReadResult:
     """Container returned by loaders with records and auxiliary metadata."""
 
     records: pl.DataFrame | pa.Table
-    metadata: Dict[str, Any] = None  # type: ignore[assignment]
-
-    def __post_init__(self) -> None:  # pragma: no cover - defensive
-        if self.metadata is None:
-            object.__setattr__(self, "metadata", {})
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 LoaderFn = Callable[[str | Path], FormatReadResult]
@@ -39,17 +39,66 @@ class FormatHandler:
     detector: Optional[DetectorFn] = None
 
     def matches(self, format_name: str) -> bool:
+        # name/aliases are stored lowercased by register_handler
         normalized = format_name.lower()
         return normalized == self.name or normalized in self.aliases
 
 
+# Built-in loader modules and the keys (name first, then aliases) each one registers.
+# Modules are imported on first use so that, e.g., a CSV ingest never pulls in the
+# Excel or PDF dependencies.
+_BUILTIN_HANDLERS: Dict[str, tuple[str, ...]] = {
+    ".csv": ("csv", "text/csv"),
+    ".excel": ("xlsx", "xls", "application/vnd.ms-excel", "application/vnd.openxmlformats"),
+    ".html": ("html", "htm", "text/html"),
+    ".pdf": ("pdf", "application/pdf"),
+}
+_BUILTIN_MODULES: Dict[str, str] = {
+    key: module for module, keys in _BUILTIN_HANDLERS.items() for key in keys
+}
+
 _REGISTRY: Dict[str, FormatHandler] = {}
 _ORDER: list[FormatHandler] = []
+# Every prefix of every registered key, so partial suffixes resolve with one lookup.
+_PREFIX_INDEX: Dict[str, FormatHandler] = {}
 
 
-def register_handler(handler: FormatHandler) -> None:
-    """Register a new format handler in the registry."""
+def _rebuild_prefix_index() -> None:
+    """Recompute the prefix index; earlier registry keys win on shared prefixes."""
+
+    _PREFIX_INDEX.clear()
+    for key, handler in _REGISTRY.items():
+        for end in range(1, len(key) + 1):
+            _PREFIX_INDEX.setdefault(key[:end], handler)
+
+
+def _load_builtin(key: str) -> None:
+    """Import the built-in loader module registering ``key``, if there is one."""
+
+    module = _BUILTIN_MODULES.get(key)
+    if module is not None:
+        importlib.import_module(module, __name__)
+
+
+def _load_all_builtins() -> None:
+    for module in _BUILTIN_HANDLERS:
+        importlib.import_module(module, __name__)
+
 
+def register_handler(handler: FormatHandler) -> None:
+    """Register a new format handler in the registry.
+
+    The handler name and aliases are lowercased and interned here, once, so lookups
+    only ever need to normalise the incoming key.
+    """
+
+    handler = replace(
+        handler,
+        name=sys.intern(handler.name.lower()),
+        aliases=tuple(sys.intern(alias.lower()) for alias in handler.aliases),
+    )
+    if _REGISTRY.get(handler.name) == handler:
+        return
     if handler.name in _REGISTRY:
         raise ValueError(f"Handler for format '{handler.name}' already registered")
     _REGISTRY[handler.name] = handler
@@ -58,56 +107,88 @@ def register_handler(handler: FormatHandler) -> None:
             logger.warning("Alias %s already registered, overriding", alias)
         _REGISTRY[alias] = handler
     _ORDER.append(handler)
+    _rebuild_prefix_index()
 
 
 def iter_handlers() -> Iterable[FormatHandler]:
-    """Iterate over handlers in registration order."""
+    """Iterate over handlers in registration order, loading all built-in handlers."""
 
+    _load_all_builtins()
     return tuple(_ORDER)
 
 
+def _as_path(source: str | Path) -> tuple[Path, str]:
+    """Return ``source`` as a path together with its lowercased, dot-less suffix."""
+
+    path = source if isinstance(source, Path) else Path(source)
+    return path, path.suffix.lower().lstrip(".")
+
+
 def detect_format(source: str | Path, format_hint: str | None = None) -> str:
     """Detect source format using explicit hint, extension and registered detectors."""
 
+    path, suffix = _as_path(source)
+    return _detect_format(path, suffix, format_hint)
+
+
+def _detect_format(path: Path, suffix: str, format_hint: str | None) -> str:
     if format_hint:
         hint = format_hint.lower()
+        _load_builtin(hint)
         handler = _REGISTRY.get(hint)
         if handler:
             return handler.name
         logger.warning("Unknown format hint '%s', falling back to auto detection", format_hint)
 
-    path = Path(str(source))
-    suffix = path.suffix.lower().lstrip(".")
     if suffix:
+        # exact match first, then partial extensions that prefix a registered one
+        _load_builtin(suffix)
         handler = _REGISTRY.get(suffix)
+        if handler is None:
+            _load_all_builtins()
+            handler = _PREFIX_INDEX.get(suffix)
         if handler:
             return handler.name
-        # handle compound extensions like .xlsm
-        for registered_suffix, registered_handler in _REGISTRY.items():
-            if registered_suffix.startswith(suffix):
-                return registered_handler.name
 
     for handler in iter_handlers():
-        if handler.detector and handler.detector(source):
+        if handler.detector and handler.detector(path):
             return handler.name
 
-    raise ValueError(f"Unable to detect format for source: {source}")
+    raise ValueError(f"Unable to detect format for source: {path}")
 
 
 def load_records(source: str | Path, format_hint: str | None = None) -> FormatReadResult:
     """Load records from the provided source by dispatching to a registered handler."""
 
-    fmt = detect_format(source, format_hint=format_hint)
+    # the path and suffix are derived once and shared by detection and the loader
+    path, suffix = _as_path(source)
+    fmt = _detect_format(path, suffix, format_hint)
     handler = _REGISTRY[fmt]
-    logger.info("Loading records", extra={"context": {"source": str(source), "format": fmt}})
-    return handler.loader(source)
+    logger.info("Loading records", extra={"context": {"source": str(path), "format": fmt}})
+    return handler.loader(path)
+
+
+def load_records_many(
+    sources: Iterable[str | Path],
+    format_hint: str | None = None,
+    *,
+    max_workers: int | None = None,
+) -> list[FormatReadResult]:
+    """Load several sources concurrently, returning results in input order.
+
+    Loaders spend most of their time in Polars/lxml code that releases the GIL, so a
+    thread pool scales across files without the cost of forking processes.
+    """
 
+    sources = list(sources)
+    if len(sources) <= 1:
+        return [load_records(source, format_hint=format_hint) for source in sources]
+    workers = min(len(sources), max_workers or os.cpu_count() or 1)
+    # resolve lazy built-in imports up front rather than racing on them in worker threads
+    _load_all_builtins()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda source: load_records(source, format_hint), sources))
 
-# Register built-in handlers.
-from . import csv as csv_handler  # noqa: E402  (registration side effects)
-from . import excel as excel_handler  # noqa: E402
-from . import html as html_handler  # noqa: E402
-from . import pdf as pdf_handler  # noqa: E402
 
 __all__ = [
     "FormatReadResult",
@@ -115,5 +196,6 @@ __all__ = [
     "detect_format",
     "iter_handlers",
     "load_records",
+    "load_records_many",
     "register_handler",
 ]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+import re
+from typing import Sequence, TypeVar
 
 import polars as pl
+import polars.selectors as cs
 
-from ..schemas import normalize_columns
+from ..schemas import REVERSE_COLUMN_MAP
 from ..utils import ensure_unique, normalize_header
 
 logger = logging.getLogger("app.formats")
@@ -19,6 +21,10 @@ SERVICE_ROW_PATTERNS: tuple[str, ...] = (
     "generated",
     "source:",
 )
+_SERVICE_ROW_RE = "^(?:" + "|".join(re.escape(pattern) for pattern in SERVICE_ROW_PATTERNS) + ")"
+SERVICE_ROW_LIMIT = 10
+
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
 
 
 def ensure_polars(data: pl.DataFrame | Sequence[dict[str, object]] | None) -> pl.DataFrame:
@@ -31,52 +37,46 @@ def ensure_polars(data: pl.DataFrame | Sequence[dict[str, object]] | None) -> pl
     return pl.DataFrame(data)
 
 
-def clean_headers(df: pl.DataFrame) -> pl.DataFrame:
+def clean_headers(df: FrameT) -> FrameT:
     """Normalize headers to snake_case and ensure uniqueness."""
 
-    renamed = normalize_columns(df.columns)
-    columns = [normalize_header(name) for name in df.columns]
-    columns = ensure_unique(columns)
-    df = df.rename(dict(zip(df.columns, columns)))
-    if renamed:
-        df = df.rename({normalize_header(src): dst for src, dst in renamed.items()})
-    return df
+    # each header is normalised once; canonical aliases are resolved on the snake_case form
+    snake = [normalize_header(name) for name in df.columns]
+    columns = ensure_unique(REVERSE_COLUMN_MAP.get(name, name) for name in snake)
+    return df.rename(dict(zip(df.columns, columns)))
 
 
-def strip_whitespace(df: pl.DataFrame) -> pl.DataFrame:
-    """Strip surrounding whitespace from string columns."""
+def normalize_strings(df: FrameT) -> FrameT:
+    """Strip whitespace and replace comma decimal separators in all string columns.
 
-    string_columns = [col for col, dtype in zip(df.columns, df.dtypes) if dtype == pl.Utf8]
-    if not string_columns:
-        return df
-    return df.with_columns([pl.col(col).str.strip().alias(col) for col in string_columns])
+    Stripping first is enough: swapping ``,`` for ``.`` cannot introduce surrounding
+    whitespace, so no second strip pass is needed.
+    """
 
+    expr = cs.string().str.strip_chars().str.replace_all(",", ".", literal=True)
+    return df.with_columns(expr)
 
-def normalize_decimals(df: pl.DataFrame) -> pl.DataFrame:
-    """Replace comma decimal separators with dots for string columns."""
 
-    string_columns = [col for col, dtype in zip(df.columns, df.dtypes) if dtype == pl.Utf8]
-    if not string_columns:
-        return df
-    updates = []
-    for col in string_columns:
-        updates.append(pl.col(col).str.replace_all(",", ".").alias(col))
-    return df.with_columns(updates)
+def count_service_rows(head: pl.DataFrame) -> int:
+    """Return how many leading rows of ``head`` are blank or service rows."""
+
+    if head.is_empty() or not head.columns:
+        return 0
+    cells = [
+        pl.col(name).cast(pl.Utf8).str.strip_chars().str.to_lowercase() for name in head.columns
+    ]
+    blank = pl.all_horizontal([cell.is_null() | (cell == "") for cell in cells])
+    service = pl.any_horizontal([cell.str.contains(_SERVICE_ROW_RE) for cell in cells])
+    droppable = head.select((blank | service.fill_null(False)).alias("drop")).to_series()
+    # only the leading run of service rows is removed
+    kept = (~droppable).arg_true()
+    return droppable.len() if kept.is_empty() else int(kept[0])
 
 
-def drop_service_rows(df: pl.DataFrame, limit: int = 10) -> pl.DataFrame:
+def drop_service_rows(df: pl.DataFrame, limit: int = SERVICE_ROW_LIMIT) -> pl.DataFrame:
     """Trim leading service rows (watermarks, page markers)."""
 
-    drop_count = 0
-    for row in df.head(limit).iter_rows():
-        values = [str(value).strip().lower() for value in row if value is not None]
-        if not values or all(value == "" for value in values):
-            drop_count += 1
-            continue
-        if any(value.startswith(pattern) for pattern in SERVICE_ROW_PATTERNS for value in values):
-            drop_count += 1
-            continue
-        break
+    drop_count = count_service_rows(df.head(limit))
     if drop_count:
         df = df.slice(drop_count, df.height - drop_count)
     return df
@@ -88,14 +88,26 @@ def sanitize(df: pl.DataFrame) -> pl.DataFrame:
     if df.is_empty():
         return df
     df = clean_headers(df)
-    df = strip_whitespace(df)
+    # service-row detection strips and lowercases values itself, so it can run first
     df = drop_service_rows(df)
-    df = normalize_decimals(df)
-    # strip whitespace again in case decimal normalization introduced spaces
-    df = strip_whitespace(df)
+    df = normalize_strings(df)
     return df
 
 
+def sanitize_lazy(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Lazy counterpart of :func:`sanitize` for scan-based loaders.
+
+    Only the first ``SERVICE_ROW_LIMIT`` rows are collected (to count service rows);
+    everything else stays in the query plan and streams with the final ``collect``.
+    """
+
+    lf = clean_headers(lf)
+    drop_count = count_service_rows(lf.head(SERVICE_ROW_LIMIT).collect())
+    if drop_count:
+        lf = lf.slice(drop_count)
+    return normalize_strings(lf)
+
+
 def dataframe_from_rows(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> pl.DataFrame:
     """Construct a dataframe from row data ensuring canonical headers."""
 
@@ -103,5 +115,7 @@ def dataframe_from_rows(headers: Sequence[str], rows: Sequence[Sequence[str]]) -
         return pl.DataFrame()
     normalized_headers = [normalize_header(header) for header in headers]
     normalized_headers = ensure_unique(normalized_headers)
-    df = pl.DataFrame(rows, schema=list(normalized_headers))
+    # cells are text; an explicit Utf8 row schema skips dtype guessing and orientation sniffing
+    schema = {header: pl.Utf8 for header in normalized_headers}
+    df = pl.DataFrame(rows, schema=schema, orient="row")
     return sanitize(df)
@@ -8,15 +8,15 @@ from typing import Any
 import polars as pl
 
 from . import FormatHandler, FormatReadResult, register_handler
-from ._common import sanitize
+from ._common import sanitize_lazy
 
 
 def _detect(source: str | Path) -> bool:
-    return Path(str(source)).suffix.lower() == ".csv"
+    return Path(source).suffix.lower() == ".csv"
 
 
 def _load(source: str | Path) -> FormatReadResult:
-    path = Path(str(source))
+    path = Path(source)
     scan = pl.scan_csv(
         path,
         has_header=True,
@@ -24,8 +24,7 @@ def _load(source: str | Path) -> FormatReadResult:
         ignore_errors=True,
         null_values=["", "null", "NULL"],
     )
-    df = scan.collect(streaming=True)
-    df = sanitize(df)
+    df = sanitize_lazy(scan).collect(streaming=True)
     metadata: dict[str, Any] = {"source_path": str(path)}
     return FormatReadResult(records=df, metadata=metadata)
 
@@ -1,11 +1,10 @@
-"""Excel format loader using pandas/openpyxl."""
+"""Excel format loader using Polars' calamine engine with a pandas/openpyxl fallback."""
 
 from __future__ import annotations
 
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
 import polars as pl
 
 from . import FormatHandler, FormatReadResult, register_handler
@@ -16,20 +15,35 @@ EXCEL_SUFFIXES = {".xls", ".xlsx", ".xlsm"}
 
 
 def _detect(source: str | Path) -> bool:
-    return Path(str(source)).suffix.lower() in EXCEL_SUFFIXES
+    return Path(source).suffix.lower() in EXCEL_SUFFIXES
 
 
-def _load(source: str | Path) -> FormatReadResult:
-    path = Path(str(source))
+def _read_with_calamine(path: Path) -> pl.DataFrame:
+    # All cells are read as strings, mirroring ``pd.read_excel(dtype=str)``.
+    return pl.read_excel(path, engine="calamine", read_options={"dtypes": "string"})
+
+
+def _read_with_pandas(path: Path) -> pl.DataFrame:  # pragma: no cover - fallback path
     try:
-        frame = pd.read_excel(path, dtype=str)
+        import pandas as pd
+
+        try:
+            frame = pd.read_excel(path, dtype=str)
+        except ValueError:
+            frame = pd.read_excel(path, dtype=str, engine="openpyxl")
     except ImportError as exc:  # pragma: no cover - depends on environment
         raise RuntimeError(
-            "Reading Excel files requires optional dependencies (openpyxl or xlrd)."
+            "Reading Excel files requires optional dependencies (fastexcel, openpyxl or xlrd)."
         ) from exc
-    except ValueError:
-        frame = pd.read_excel(path, dtype=str, engine="openpyxl")
-    df = pl.from_pandas(frame, include_index=False)
+    return pl.from_pandas(frame, include_index=False)
+
+
+def _load(source: str | Path) -> FormatReadResult:
+    path = Path(source)
+    try:
+        df = _read_with_calamine(path)
+    except ImportError:  # pragma: no cover - fastexcel not installed
+        df = _read_with_pandas(path)
     df = sanitize(df)
     metadata: dict[str, Any] = {"source_path": str(path)}
     return FormatReadResult(records=df, metadata=metadata)
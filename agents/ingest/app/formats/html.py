@@ -1,12 +1,12 @@
-"""HTML table loader using BeautifulSoup and lxml."""
+"""HTML table loader streaming the document with lxml."""
 
 from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, List
 
-from bs4 import BeautifulSoup
 import polars as pl
+from lxml import etree
 
 from . import FormatHandler, FormatReadResult, register_handler
 from ._common import dataframe_from_rows, sanitize
@@ -15,7 +15,16 @@ _HTML_SUFFIXES = {".html", ".htm"}
 
 
 def _detect(source: str | Path) -> bool:
-    return Path(str(source)).suffix.lower() in _HTML_SUFFIXES
+    return Path(source).suffix.lower() in _HTML_SUFFIXES
+
+
+def _cell_text(cell: Any) -> str:
+    # Same result as BeautifulSoup's ``get_text(strip=True)``.
+    return "".join(fragment.strip() for fragment in cell.itertext())
+
+
+def _row_cells(tr: Any) -> List[str]:
+    return [_cell_text(cell) for cell in tr.iter("td", "th")]
 
 
 def _extract_table(table: Any) -> pl.DataFrame:
@@ -23,19 +32,18 @@ def _extract_table(table: Any) -> pl.DataFrame:
     data_rows: List[List[str]] = []
 
     thead = table.find("thead")
-    if thead:
-        header_row = thead.find_all("tr")[-1]
-        headers = [cell.get_text(strip=True) for cell in header_row.find_all(["th", "td"])]
-        tbody_rows = table.find_all("tbody")
-        if tbody_rows:
-            for body in tbody_rows:
-                for tr in body.find_all("tr"):
-                    cells = [cell.get_text(strip=True) for cell in tr.find_all(["td", "th"])]
-                    if cells:
-                        data_rows.append(cells)
+    if thead is not None:
+        header_rows = list(thead.iter("tr"))
+        if header_rows:
+            headers = _row_cells(header_rows[-1])
+        for body in table.iter("tbody"):
+            for tr in body.iter("tr"):
+                cells = _row_cells(tr)
+                if cells:
+                    data_rows.append(cells)
     else:
-        for idx, tr in enumerate(table.find_all("tr")):
-            cells = [cell.get_text(strip=True) for cell in tr.find_all(["td", "th"])]
+        for tr in table.iter("tr"):
+            cells = _row_cells(tr)
             if not cells:
                 continue
             if not headers:
@@ -51,19 +59,37 @@ def _extract_table(table: Any) -> pl.DataFrame:
 
 
 def _load(source: str | Path) -> FormatReadResult:
-    path = Path(str(source))
-    raw_html = path.read_text(encoding="utf-8")
-    soup = BeautifulSoup(raw_html, "lxml")
+    path = Path(source)
     metadata: dict[str, Any] = {"source_path": str(path)}
-    tz_meta = soup.find("meta", attrs={"name": "report-tz"})
-    if tz_meta and tz_meta.get("content"):
-        metadata["report_timezone"] = tz_meta["content"].strip()
 
-    table = soup.find("table")
-    if table is None:
+    # Stream the document and stop at the first top-level table; anything after it is
+    # never parsed. ``<meta>`` tags precede the table in the head, so they are seen first.
+    df: pl.DataFrame | None = None
+    events = etree.iterparse(
+        str(path), events=("end",), tag=("meta", "table"), html=True, encoding="utf-8"
+    )
+    try:
+        for _, element in events:
+            if element.tag == "meta":
+                content = element.get("content")
+                if (
+                    element.get("name") == "report-tz"
+                    and content
+                    and "report_timezone" not in metadata
+                ):
+                    metadata["report_timezone"] = content.strip()
+                continue
+            if next(element.iterancestors("table"), None) is not None:
+                continue  # nested table, handled as part of its parent
+            df = _extract_table(element)
+            element.clear()
+            break
+    except etree.XMLSyntaxError as exc:
+        raise ValueError(f"Unable to parse HTML source: {source}") from exc
+
+    if df is None:
         raise ValueError(f"No <table> found in HTML source: {source}")
 
-    df = _extract_table(table)
     return FormatReadResult(records=df, metadata=metadata)
 
 
@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import io
 import logging
-import re
 from pathlib import Path
 from typing import Any, List
 
 import polars as pl
+import pyarrow as pa
 
 from . import FormatHandler, FormatReadResult, register_handler
-from ._common import sanitize
+from ._common import SERVICE_ROW_LIMIT, count_service_rows, sanitize
 
 logger = logging.getLogger("app.formats.pdf")
 
@@ -30,11 +30,11 @@ _PDF_SUFFIXES = {".pdf"}
 
 
 def _detect(source: str | Path) -> bool:
-    return Path(str(source)).suffix.lower() in _PDF_SUFFIXES
+    return Path(source).suffix.lower() in _PDF_SUFFIXES
 
 
-def _load_with_camelot(path: Path) -> list[pl.DataFrame]:  # pragma: no cover - optional
-    tables: list[pl.DataFrame] = []
+def _load_with_camelot(path: Path) -> list[pa.Table]:  # pragma: no cover - optional
+    tables: list[pa.Table] = []
     if not camelot:
         return tables
     try:
@@ -43,14 +43,12 @@ def _load_with_camelot(path: Path) -> list[pl.DataFrame]:  # pragma: no cover -
         logger.warning("Camelot failed to parse PDF %s: %s", path, exc)
         return tables
     for table in result:
-        frame = table.df.astype(str)
-        df = pl.from_pandas(frame, include_index=False)
-        tables.append(sanitize(df))
+        tables.append(pa.Table.from_pandas(table.df.astype(str), preserve_index=False))
     return tables
 
 
-def _load_with_tabula(path: Path) -> list[pl.DataFrame]:  # pragma: no cover - optional
-    tables: list[pl.DataFrame] = []
+def _load_with_tabula(path: Path) -> list[pa.Table]:  # pragma: no cover - optional
+    tables: list[pa.Table] = []
     if not tabula:
         return tables
     try:
@@ -59,12 +57,25 @@ def _load_with_tabula(path: Path) -> list[pl.DataFrame]:  # pragma: no cover - o
         logger.warning("Tabula failed to parse PDF %s: %s", path, exc)
         return tables
     for frame in result:
-        df = pl.from_pandas(frame.astype(str), include_index=False)
-        tables.append(sanitize(df))
+        tables.append(pa.Table.from_pandas(frame.astype(str), preserve_index=False))
     return tables
 
 
-_TEXT_TABLE_PATTERN = re.compile(r"^[^\S\n]*[\w\d]+([^\S\n]*[,;\t][^\S\n]*[\w\d]+)+[^\S\n]*$")
+def _load_tables(path: Path) -> List[pa.Table]:
+    """Extract tables with Camelot, falling back to Tabula when it finds none."""
+
+    return _load_with_camelot(path) or _load_with_tabula(path)
+
+
+def _trim_service_rows(table: pa.Table) -> pa.Table:
+    """Drop per-page watermark rows from the head of one extracted table (zero-copy)."""
+
+    head = pl.from_arrow(table.slice(0, SERVICE_ROW_LIMIT))
+    return table.slice(count_service_rows(head))
+
+
+# matched by Polars' linear-time Rust regex engine; \w stays Unicode-aware for Cyrillic cells
+_TEXT_TABLE_PATTERN = r"^[^\S\n]*\w+(?:[^\S\n]*[,;\t][^\S\n]*\w+)+[^\S\n]*$"
 
 
 def _fallback_text(path: Path) -> pl.DataFrame:
@@ -81,48 +92,43 @@ def _fallback_text(path: Path) -> pl.DataFrame:
     except UnicodeDecodeError:
         text = raw.decode("latin-1", errors="ignore")
 
-    table_lines: list[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if _TEXT_TABLE_PATTERN.match(stripped):
-            table_lines.append(stripped)
+    # one vectorised strip + regex pass over all lines instead of a Python loop
+    lines = pl.Series(text.splitlines(), dtype=pl.Utf8).str.strip_chars()
+    table_lines = lines.filter((lines != "") & lines.str.contains(_TEXT_TABLE_PATTERN))
 
-    if not table_lines:
+    if table_lines.is_empty():
         return pl.DataFrame()
 
     delimiter = ","
-    if all(";" in line for line in table_lines):
+    if table_lines.str.contains(";", literal=True).all():
         delimiter = ";"
-    elif all("\t" in line for line in table_lines):
+    elif table_lines.str.contains("\t", literal=True).all():
         delimiter = "\t"
 
-    pseudo_csv = "\n".join(table_lines)
-    buffer = io.StringIO(pseudo_csv)
+    buffer = io.BytesIO("\n".join(table_lines.to_list()).encode("utf-8"))
     df = pl.read_csv(buffer, separator=delimiter)
     return sanitize(df)
 
 
 def _load(source: str | Path) -> FormatReadResult:
-    path = Path(str(source))
+    path = Path(source)
     metadata: dict[str, Any] = {"source_path": str(path)}
 
-    tables: List[pl.DataFrame] = []
-    tables.extend(_load_with_camelot(path))
-    if not tables:
-        tables.extend(_load_with_tabula(path))
+    tables = _load_tables(path)
 
     if tables:
-        combined = pl.concat(tables, how="vertical", rechunk=True)
-        combined = sanitize(combined)
-        return FormatReadResult(records=combined, metadata=metadata)
+        # tables are sanitised once, after being combined into contiguous Arrow buffers
+        tables = [_trim_service_rows(table) for table in tables]
+        combined = pa.concat_tables(tables, promote_options="default").combine_chunks()
+        combined = sanitize(pl.from_arrow(combined))
+        # hand one contiguous chunk per column to normalisation (no-op if already contiguous)
+        return FormatReadResult(records=combined.rechunk(), metadata=metadata)
 
     logger.warning("Falling back to text extraction for PDF %s", path)
     metadata["degraded"] = True
+    # _fallback_text already returns a sanitised frame
     df = _fallback_text(path)
-    df = sanitize(df)
-    return FormatReadResult(records=df, metadata=metadata)
+    return FormatReadResult(records=df.rechunk(), metadata=metadata)
 
 
 register_handler(
@@ -20,7 +20,7 @@ class LineageRecorder:
     storage: StorageClient
     schema_version: str = "1.0"
 
-    def record(
+    def build(
         self,
         *,
         source: str,
@@ -33,10 +33,9 @@ class LineageRecorder:
         normalized_uri: str,
         prefix: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Build and persist lineage data returning the payload."""
+        """Build the lineage payload without uploading it."""
 
         checksum = compute_file_checksum(source)
-        raw_df = ensure_polars(raw_data)
         norm_df = ensure_polars(normalized)
         valid_df = norm_df.filter(~pl.col("superseded")) if "superseded" in norm_df.columns else norm_df
 
@@ -48,7 +47,7 @@ class LineageRecorder:
                 "checksum": checksum,
             },
             "counts": {
-                "raw": int(raw_df.height),
+                "raw": len(raw_data) if raw_data is not None else 0,
                 "normalized": int(norm_df.height),
                 "valid": int(valid_df.height),
                 "invalid": int(counters.get("invalid", 0)),
@@ -60,11 +59,26 @@ class LineageRecorder:
                 "lineage": lineage_uri,
             },
         }
-        self.storage.upload_json(year, version, "lineage", payload, prefix=prefix)
-        payload["uri"] = lineage_uri
-        payload["checksum"] = checksum
         return payload
 
+    def record(
+        self,
+        *,
+        year: int,
+        version: str,
+        prefix: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Build and persist lineage data returning the payload."""
+
+        payload = self.build(year=year, version=version, prefix=prefix, **kwargs)
+        self.storage.upload_json(year, version, "lineage", payload, prefix=prefix)
+        return {
+            **payload,
+            "uri": payload["artifacts"]["lineage"],
+            "checksum": payload["source"]["checksum"],
+        }
+
 
 def ensure_polars(data: pl.DataFrame | pa.Table | None) -> pl.DataFrame:
     """Convert arbitrary tabular data to a Polars DataFrame."""
@@ -76,17 +90,18 @@ def ensure_polars(data: pl.DataFrame | pa.Table | None) -> pl.DataFrame:
     return pl.from_arrow(data)
 
 
-def compute_file_checksum(path: str | Path, chunk_size: int = 1024 * 1024) -> str:
+def compute_file_checksum(path: str | Path, chunk_size: int = 1 << 20) -> str:
     """Calculate SHA256 checksum for the provided file path."""
 
     file_path = Path(path)
     if not file_path.exists():
         return ""
-    digest = hashlib.sha256()
     with file_path.open("rb") as handle:
-        while True:
-            chunk = handle.read(chunk_size)
-            if not chunk:
-                break
-            digest.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := handle.readinto(buffer):
+            digest.update(view[:size])
     return digest.hexdigest()
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 from typing import Any, Dict, Tuple
 from uuid import NAMESPACE_URL, uuid5
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import pendulum
 import polars as pl
@@ -15,68 +16,190 @@ from .schemas import (
     BOOLEAN_FIELDS,
     CANONICAL_ORDER,
     CANONICAL_STRINGS,
+    DATETIME_FIELDS,
     NUMERIC_FIELDS,
     normalize_columns,
 )
 
 
 def _to_polars(data: pl.DataFrame | pa.Table) -> pl.DataFrame:
+    """Return ``data`` as a DataFrame without copying.
+
+    Every transformation below returns a new frame, so the caller's frame is never
+    mutated and sharing its Arrow buffers is safe.
+    """
+
     if isinstance(data, pl.DataFrame):
-        return data.clone()
+        return data
     return pl.from_arrow(data)
 
 
-def _parse_datetime(value: Any, tz_hint: str | None) -> datetime | None:
+def _parse_datetime(value: Any, tz: tzinfo) -> datetime | None:
+    """Parse one value to UTC; naive values are interpreted in the pre-resolved ``tz``."""
+
     if value is None:
         return None
     if isinstance(value, datetime):
-        if value.tzinfo is None:
-            tz = tz_hint or "UTC"
-            dt = pendulum.instance(value, tz=tz)
-        else:
-            dt = pendulum.instance(value)
+        dt = value
     else:
         text = str(value).strip()
         if not text:
             return None
         try:
-            dt = pendulum.parse(text, tz=tz_hint, strict=False)
-        except Exception:
-            return None
-    if dt.tzinfo is None:
-        if tz_hint:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            # pendulum's lenient parser is only needed for non-ISO input
             try:
-                tz = pendulum.timezone(tz_hint)
+                dt = pendulum.parse(text, tz=None, strict=False)
             except Exception:
-                tz = pendulum.UTC
-            dt = dt.replace(tzinfo=tz)
-        else:
-            dt = dt.replace(tzinfo=pendulum.UTC)
-    return dt.in_timezone(pendulum.UTC)
+                return None
+        if not isinstance(dt, datetime):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=tz)
+    return dt.astimezone(timezone.utc)
 
 
-def _ensure_column(df: pl.DataFrame, name: str, dtype: pl.DataType, default: Any = None) -> pl.DataFrame:
-    if name in df.columns:
-        return df
-    return df.with_columns(pl.lit(default, dtype=dtype).alias(name))
+_UTC_DATETIME = pl.Datetime("us", "UTC")
 
+# formats tried, in order, by the vectorised parser; anything else falls back to pendulum.
+# Dotted dates are left to pendulum so ambiguous ones keep their month-first reading.
+_NAIVE_DATETIME_FORMATS: Tuple[str, ...] = (
+    "%Y-%m-%dT%H:%M:%S%.f",
+    "%Y-%m-%d %H:%M:%S%.f",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+)
+_AWARE_DATETIME_FORMATS: Tuple[str, ...] = (
+    "%Y-%m-%dT%H:%M:%S%.f%#z",
+    "%Y-%m-%d %H:%M:%S%.f%#z",
+)
 
-def _generate_surrogate(row: dict[str, Any]) -> str | None:
-    if row.get("flight_id"):
-        return None
-    start = row.get("start_time_utc")
-    end = row.get("end_time_utc")
-    region = row.get("region_code") or row.get("region_name")
-    if not start or not end:
-        return None
-    base = "|".join(
-        str(part)
-        for part in (start, end, region)
-        if part is not None
+
+def _resolve_timezone(tz_hint: str | None) -> str:
+    if not tz_hint:
+        return "UTC"
+    try:
+        ZoneInfo(tz_hint)
+    except (ZoneInfoNotFoundError, ValueError):
+        return "UTC"
+    return tz_hint
+
+
+def _localize(expr: pl.Expr, time_zone: str) -> pl.Expr:
+    return expr.dt.replace_time_zone(
+        time_zone, ambiguous="earliest", non_existent="null"
+    ).dt.convert_time_zone("UTC")
+
+
+def _datetime_expr(column: str, dtype: pl.PolarsDataType, time_zone: str) -> pl.Expr:
+    """Build a native expression converting ``column`` to UTC timestamps."""
+
+    col = pl.col(column)
+    if dtype == pl.Date:
+        return _localize(col.cast(pl.Datetime("us")), time_zone)
+    if isinstance(dtype, pl.Datetime):
+        col = col.dt.cast_time_unit("us")
+        if dtype.time_zone is None:
+            return _localize(col, time_zone)
+        return col.dt.convert_time_zone("UTC")
+
+    text = col.cast(pl.Utf8, strict=False).str.strip_chars()
+    aware = [
+        text.str.to_datetime(fmt, time_unit="us", strict=False).dt.convert_time_zone("UTC")
+        for fmt in _AWARE_DATETIME_FORMATS
+    ]
+    naive = pl.coalesce(
+        [text.str.to_datetime(fmt, time_unit="us", strict=False) for fmt in _NAIVE_DATETIME_FORMATS]
+    )
+    return pl.coalesce([*aware, _localize(naive, time_zone)])
+
+
+def _parse_stragglers(raw: pl.Series, parsed: pl.Series, tz: tzinfo) -> pl.Series:
+    """Parse values the vectorised formats missed, one by one, in Python."""
+
+    if raw.dtype != pl.Utf8:
+        return parsed
+    pending = (parsed.is_null() & (raw.str.strip_chars().str.len_chars() > 0)).arg_true()
+    if pending.is_empty():
+        return parsed
+    values = pl.Series(
+        [_parse_datetime(value, tz) for value in raw.gather(pending)], dtype=_UTC_DATETIME
+    )
+    return parsed.scatter(pending, values)
+
+
+def _straggler_expr(column: str, tz: tzinfo) -> pl.Expr:
+    target = f"{column}_utc"
+    return (
+        pl.struct([column, target])
+        .map_batches(
+            lambda batch: _parse_stragglers(
+                batch.struct.field(column), batch.struct.field(target), tz
+            ),
+            return_dtype=_UTC_DATETIME,
+        )
+        .alias(target)
+    )
+
+
+def _canonical_default(column: str) -> pl.Expr:
+    if column in NUMERIC_FIELDS:
+        return pl.lit(None, dtype=pl.Float64).alias(column)
+    if column in CANONICAL_STRINGS:
+        return pl.lit(None, dtype=pl.Utf8).alias(column)
+    if column in BOOLEAN_FIELDS:
+        return pl.lit(False).alias(column)
+    return pl.lit(None).alias(column)
+
+
+def _numeric_expr(column: str, dtype: pl.PolarsDataType) -> pl.Expr:
+    col = pl.col(column)
+    if dtype == pl.Utf8:
+        # comma decimal separators are common in the regional exports
+        col = col.str.strip_chars().str.replace(",", ".", literal=True)
+    return col.cast(pl.Float64, strict=False)
+
+
+def _datetime_text(column: str) -> pl.Expr:
+    """Render timestamps the way ``str(datetime)`` does, keeping surrogate ids stable."""
+
+    col = pl.col(column)
+    return (
+        pl.when(col.dt.microsecond() == 0)
+        .then(col.dt.strftime("%Y-%m-%d %H:%M:%S%:z"))
+        .otherwise(col.dt.strftime("%Y-%m-%d %H:%M:%S%.6f%:z"))
+    )
+
+
+def _surrogate_base() -> pl.Expr:
+    """Key hashed into surrogate ids; null for rows that do not need one."""
+
+    region_code = pl.col("region_code")
+    region = (
+        pl.when(region_code.is_not_null() & (region_code != ""))
+        .then(region_code)
+        .otherwise(pl.col("region_name"))
+    )
+    base = pl.concat_str(
+        [_datetime_text("start_time_utc"), _datetime_text("end_time_utc"), region],
+        separator="|",
+        ignore_nulls=True,
+    )
+    needs_surrogate = (
+        (pl.col("flight_id").is_null() | (pl.col("flight_id") == ""))
+        & pl.col("start_time_utc").is_not_null()
+        & pl.col("end_time_utc").is_not_null()
+    )
+    return pl.when(needs_surrogate).then(base)
+
+
+def _uuid5_batch(base: pl.Series) -> pl.Series:
+    return pl.Series(
+        [None if value is None else str(uuid5(NAMESPACE_URL, value)) for value in base.to_list()],
+        dtype=pl.Utf8,
     )
-    if not base:
-        return None
-    return str(uuid5(NAMESPACE_URL, base))
 
 
 def normalize_records(
@@ -103,84 +226,93 @@ def normalize_records(
         df = df.rename(rename_map)
 
     total_records = df.height
+    columns = set(df.columns)
+
+    # the rest is one lazy plan, executed by a single collect at the end
+    lf = df.lazy()
 
-    # Normalize strings
-    for column in set(df.columns) & set(CANONICAL_STRINGS):
-        df = df.with_columns(pl.col(column).cast(pl.Utf8, strict=False).str.strip().alias(column))
+    # Normalize strings in one pass; missing canonical string columns become typed nulls
+    lf = lf.with_columns(
+        pl.col(column).cast(pl.Utf8, strict=False).str.strip_chars().alias(column)
+        if column in columns
+        else _canonical_default(column)
+        for column in CANONICAL_STRINGS
+    )
 
     # Parse datetime columns
-    datetime_columns = [col for col in ("start_time", "end_time") if col in df.columns]
-    for column in datetime_columns:
-        target = f"{column}_utc"
-        df = df.with_columns(
-            pl.col(column)
-            .map_elements(lambda value: _parse_datetime(value, report_timezone), return_dtype=pl.Datetime("us", "UTC"))
-            .alias(target)
-        )
-    df = _ensure_column(df, "start_time_utc", pl.Datetime("us", "UTC"))
-    df = _ensure_column(df, "end_time_utc", pl.Datetime("us", "UTC"))
+    datetime_columns = [col for col in DATETIME_FIELDS if col in columns]
+    time_zone = _resolve_timezone(report_timezone)
+    # resolved once; the per-row fallback parser only receives the tzinfo object
+    zone = ZoneInfo(time_zone)
+    # parsed and missing UTC columns are produced in the same pass; pre-existing ones are kept
+    lf = lf.with_columns(
+        _datetime_expr(column, df.schema[column], time_zone).alias(f"{column}_utc")
+        if column in columns
+        else pl.lit(None, dtype=_UTC_DATETIME).alias(f"{column}_utc")
+        for column in DATETIME_FIELDS
+        if column in columns or f"{column}_utc" not in columns
+    )
+    # only the rare values outside the known formats go through the per-row parser
+    lf = lf.with_columns(
+        _straggler_expr(column, zone)
+        for column in datetime_columns
+        if df.schema[column] == pl.Utf8
+    )
 
     # Drop the original datetime columns to avoid ambiguity
-    df = df.drop([col for col in ("start_time", "end_time") if col in df.columns])
+    lf = lf.drop(datetime_columns)
 
-    # Duration calculation
+    # Numeric casts, missing numeric columns and the duration fallback in one pass
     duration_expr = (
         (pl.col("end_time_utc") - pl.col("start_time_utc")).dt.total_minutes()
     )
-    if "duration_minutes" in df.columns:
-        df = df.with_columns(
-            pl.when(pl.col("duration_minutes").cast(pl.Float64, strict=False).is_not_null())
-            .then(pl.col("duration_minutes").cast(pl.Float64, strict=False))
-            .otherwise(duration_expr)
-            .alias("duration_minutes")
+    numeric_exprs = []
+    for column in NUMERIC_FIELDS:
+        value = (
+            _numeric_expr(column, df.schema[column])
+            if column in columns
+            else pl.lit(None, dtype=pl.Float64)
         )
-    else:
-        df = df.with_columns(duration_expr.alias("duration_minutes"))
-
-    for numeric_column in NUMERIC_FIELDS:
-        df = _ensure_column(df, numeric_column, pl.Float64, default=None)
-        df = df.with_columns(pl.col(numeric_column).cast(pl.Float64, strict=False).alias(numeric_column))
+        if column == "duration_minutes":
+            value = pl.coalesce([value, duration_expr])
+        numeric_exprs.append(value.alias(column))
+    lf = lf.with_columns(numeric_exprs)
 
     # Coordinate validation
-    lat_valid = (pl.col("latitude").is_null() | pl.col("latitude").is_between(-90, 90))
-    lon_valid = (pl.col("longitude").is_null() | pl.col("longitude").is_between(-180, 180))
-    df = df.with_columns(
-        pl.when(lat_valid).then(pl.col("latitude")).otherwise(pl.lit(None, dtype=pl.Float64)).alias("latitude"),
-        pl.when(lon_valid).then(pl.col("longitude")).otherwise(pl.lit(None, dtype=pl.Float64)).alias("longitude"),
-        (~lat_valid | ~lon_valid).alias("_invalid_coord"),
+    # the range masks are materialised once and then reused as plain column lookups
+    lf = lf.with_columns(
+        (pl.col("latitude").is_null() | pl.col("latitude").is_between(-90, 90)).alias("_lat_ok"),
+        (pl.col("longitude").is_null() | pl.col("longitude").is_between(-180, 180)).alias(
+            "_lon_ok"
+        ),
     )
-
-    # Ensure string columns exist
-    for column in CANONICAL_STRINGS:
-        df = _ensure_column(df, column, pl.Utf8, default=None)
-        df = df.with_columns(pl.col(column).cast(pl.Utf8, strict=False).alias(column))
-
-    df = _ensure_column(df, "flight_id", pl.Utf8, default=None)
-
-    df = df.with_columns(
-        pl.struct(["flight_id", "start_time_utc", "end_time_utc", "region_code", "region_name"])
-        .map_elements(_generate_surrogate, return_dtype=pl.Utf8)
-        .alias("surrogate_id")
+    lf = lf.with_columns(
+        pl.when(pl.col("_lat_ok")).then(pl.col("latitude")).alias("latitude"),
+        pl.when(pl.col("_lon_ok")).then(pl.col("longitude")).alias("longitude"),
+        (~pl.col("_lat_ok") | ~pl.col("_lon_ok")).alias("_invalid_coord"),
+    ).drop(["_lat_ok", "_lon_ok"])
+
+    lf = lf.with_columns(
+        _surrogate_base().map_batches(_uuid5_batch, return_dtype=pl.Utf8).alias("surrogate_id")
     )
-    df = df.with_columns(
+    lf = lf.with_columns(
         pl.when(pl.col("flight_id").is_null() | (pl.col("flight_id").str.len_chars() == 0))
         .then(pl.col("surrogate_id"))
         .otherwise(pl.col("flight_id"))
         .alias("flight_id")
     )
 
-    df = _ensure_column(df, "superseded", pl.Boolean, default=False)
-    df = df.with_columns(pl.col("superseded").cast(pl.Boolean, strict=False).fill_null(False).alias("superseded"))
-
     invalid_mask = (
         pl.col("start_time_utc").is_null()
         | pl.col("end_time_utc").is_null()
         | (pl.col("end_time_utc") < pl.col("start_time_utc"))
     ) | pl.col("_invalid_coord")
-    df = df.with_columns(invalid_mask.alias("_invalid"))
-    invalid_count = df.filter(pl.col("_invalid")).height
+    lf = lf.with_columns(invalid_mask.alias("_invalid"))
 
-    df = df.filter(~pl.col("_invalid"))
+    # the parsing plan runs exactly once: invalid rows are counted and dropped on the result
+    df = lf.collect(streaming=True)
+    invalid_count = int(df["_invalid"].sum())
+    lf = df.lazy().filter(~pl.col("_invalid"))
 
     # Deduplication
     key = pl.concat_str(
@@ -191,28 +323,17 @@ def normalize_records(
         ],
         separator="|",
     )
-    df = df.with_columns(
-        key.alias("_dedupe_key"),
-        pl.col("_dedupe_key").cumcount().over("_dedupe_key").alias("_dup_idx"),
-        pl.count().over("_dedupe_key").alias("_dup_total"),
-    )
-    df = df.with_columns((pl.col("_dup_idx") < pl.col("_dup_total") - 1).alias("superseded"))
-    duplicate_count = int(df.filter(pl.col("superseded")).height)
-    df = df.drop(["_dedupe_key", "_dup_idx", "_dup_total", "_invalid", "_invalid_coord"])
+    # every occurrence of a key except the last one is superseded
+    lf = lf.with_columns((~key.is_last_distinct()).alias("superseded"))
 
     # Ensure canonical columns exist with defaults
-    for column in CANONICAL_ORDER:
-        if column not in df.columns:
-            if column in NUMERIC_FIELDS:
-                df = df.with_columns(pl.lit(None, dtype=pl.Float64).alias(column))
-            elif column in CANONICAL_STRINGS:
-                df = df.with_columns(pl.lit(None, dtype=pl.Utf8).alias(column))
-            elif column in BOOLEAN_FIELDS:
-                df = df.with_columns(pl.lit(False).alias(column))
-            else:
-                df = df.with_columns(pl.lit(None).alias(column))
-
-    df = df.select(CANONICAL_ORDER)
+    present = set(lf.columns)
+    missing = [_canonical_default(column) for column in CANONICAL_ORDER if column not in present]
+    lf = lf.with_columns(missing).select(CANONICAL_ORDER)
+
+    df = lf.collect()
+    duplicate_count = int(df["superseded"].sum())
+
     table = df.to_arrow()
     counters = {
         "total": total_records,
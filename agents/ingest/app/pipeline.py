@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Tuple
+from types import TracebackType
+from typing import Optional, Tuple, Type
 
 import pendulum
-import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from .config import AppSettings
 from .formats import detect_format, load_records
-from .lineage import LineageRecorder, ensure_polars as ensure_polars_df
+from .lineage import LineageRecorder
 from .logging import get_logger
 from .normalization import normalize_records
 from .repository import DatabaseRepository
@@ -63,7 +66,10 @@ class IngestPipeline:
         table, counters = normalize_records(load_result)
 
         resolved_version = resolved_version or self._generate_version()
-        raw_df = ensure_polars_df(getattr(load_result, "records", None))
+        # raw records are uploaded as loaded (Polars or Arrow), without a conversion copy
+        raw_records = getattr(load_result, "records", None)
+        if raw_records is None:
+            raw_records = pa.table({})
         inferred_year = year or self._infer_year(table) or self.settings.default_year
         if inferred_year is None and not dry_run:
             raise ValueError("Year must be provided or derivable for persistence")
@@ -82,10 +88,11 @@ class IngestPipeline:
         if not dry_run:
             if inferred_year is None:
                 raise ValueError("Year must be provided for persistence")
-            repo = DatabaseRepository(self.settings.postgres)
-            storage = StorageClient.from_settings(self.settings)
+            repo = self.repository
+            storage = self.storage
             lineage = LineageRecorder(storage)
 
+            # one connection/transaction for the whole run; a failed upload rolls back the rows
             with repo.connection() as conn:
                 dataset_version_id = repo.create_dataset_version(
                     conn,
@@ -96,39 +103,55 @@ class IngestPipeline:
                 repo.copy_flights_raw(conn, dataset_version_id=dataset_version_id, table=table)
                 repo.upsert_flights_norm(conn, dataset_version_id=dataset_version_id, table=table)
 
-            raw_uri = storage.upload_csv(
-                int(inferred_year),
-                resolved_version,
-                "raw",
-                raw_df,
-                prefix=storage_prefix,
-            )
-            normalized_uri = storage.upload_parquet(
-                int(inferred_year),
-                resolved_version,
-                "normalized",
-                table,
-                prefix=storage_prefix,
-            )
-            lineage_payload = lineage.record(
-                source=str(source),
-                year=int(inferred_year),
-                version=resolved_version,
-                raw_data=raw_df,
-                normalized=table,
-                counters=counters,
-                raw_uri=raw_uri,
-                normalized_uri=normalized_uri,
-                prefix=storage_prefix,
-            )
-            artifacts = {
-                "raw": raw_uri,
-                "normalized": normalized_uri,
-                "lineage": lineage_payload.get("uri", ""),
-            }
-            checksum = lineage_payload.get("checksum", "")
+                year_value = int(inferred_year)
+                raw_uri = storage.build_uri(
+                    year_value, resolved_version, "raw", "csv", prefix=storage_prefix
+                )
+                normalized_uri = storage.build_uri(
+                    year_value, resolved_version, "normalized", "parquet", prefix=storage_prefix
+                )
+                lineage_payload = lineage.build(
+                    source=str(source),
+                    year=year_value,
+                    version=resolved_version,
+                    raw_data=raw_records,
+                    normalized=table,
+                    counters=counters,
+                    raw_uri=raw_uri,
+                    normalized_uri=normalized_uri,
+                    prefix=storage_prefix,
+                )
+                raw_key = storage.build_object_key(
+                    year_value, resolved_version, "raw", "csv", prefix=storage_prefix
+                )
+                lineage_key = storage.build_object_key(
+                    year_value, resolved_version, "lineage", "json", prefix=storage_prefix
+                )
+                # Parquet is spooled and uploaded by boto3 on a worker thread while CSV and
+                # lineage JSON go out together as one batch on the shared transfer manager
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    parquet_upload = executor.submit(
+                        storage.upload_parquet,
+                        year_value,
+                        resolved_version,
+                        "normalized",
+                        table,
+                        prefix=storage_prefix,
+                    )
+                    raw_uri, lineage_uri = storage.upload_many(
+                        [
+                            (storage.encode_csv(raw_records), raw_key, "text/csv"),
+                            (storage.encode_json(lineage_payload), lineage_key, "application/json"),
+                        ]
+                    )
+                    normalized_uri = parquet_upload.result()
+                artifacts = {
+                    "raw": raw_uri,
+                    "normalized": normalized_uri,
+                    "lineage": lineage_uri,
+                }
+                checksum = lineage_payload["source"]["checksum"]
 
-            with repo.connection() as conn:
                 repo.mark_ingested(
                     conn,
                     dataset_version_id=dataset_version_id,
@@ -149,6 +172,40 @@ class IngestPipeline:
         self.logger.info("Finished ingest pipeline", extra={"context": result_context})
         return table, counters
 
+    def __enter__(self) -> "IngestPipeline":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the connection pool and upload workers opened by earlier runs."""
+
+        # only clients that were actually created are closed; cached_property stores them here
+        repository = self.__dict__.pop("repository", None)
+        if repository is not None:
+            repository.close()
+        storage = self.__dict__.pop("storage", None)
+        if storage is not None:
+            storage.close()
+
+    @cached_property
+    def repository(self) -> DatabaseRepository:
+        """Database repository, created on first use."""
+
+        return DatabaseRepository(self.settings.postgres)
+
+    @cached_property
+    def storage(self) -> StorageClient:
+        """Object storage client, created on first use and reused across runs."""
+
+        return StorageClient.from_settings(self.settings)
+
     def _generate_version(self) -> str:
         """Generate dataset version identifier when not provided."""
 
@@ -161,15 +218,12 @@ class IngestPipeline:
             return None
         if "start_time_utc" not in table.column_names:
             return None
-        df = pl.from_arrow(table)
-        if "superseded" in df.columns:
-            df = df.filter(~pl.col("superseded"))
-        if df.is_empty():
-            return None
-        try:
-            year_series = df.select(pl.col("start_time_utc").dt.year().drop_nulls()).to_series()
-            if year_series.is_empty():
-                return None
-            return int(year_series.item())
-        except Exception:  # pragma: no cover - best effort
+        # pyarrow.compute works on the table in place, without a Polars copy
+        column = table.column("start_time_utc")
+        mask = pc.is_valid(column)
+        if "superseded" in table.column_names:
+            mask = pc.and_(mask, pc.invert(pc.fill_null(table.column("superseded"), False)))
+        years = pc.year(pc.filter(column, mask))
+        if len(years) == 0:
             return None
+        return int(years[0].as_py())
@@ -2,25 +2,42 @@
 
 from __future__ import annotations
 
+import io
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import date, datetime
-from typing import Dict, Iterator, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Set
 
+import orjson
 import polars as pl
 import pyarrow as pa
-from psycopg import Connection, connect
+import pyarrow.compute as pc
+from psycopg import Connection, Copy, Cursor
+from psycopg.conninfo import make_conninfo
 from psycopg.rows import dict_row
 from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
 
 from .config import PostgresSettings
 
+_COPY_CHUNK = 10_000
+_COPY_NULL = "\\N"
+_COPY_CSV_OPTIONS = "(FORMAT CSV, DELIMITER E'\\t', NULL '\\N')"
+
 
 @dataclass(slots=True)
 class DatabaseRepository:
     """Helper providing high-level persistence operations."""
 
     settings: PostgresSettings
+    # connections whose open transaction already ran the artifacts DDL
+    _artifacts_checked: Set[int] = field(default_factory=set, init=False, repr=False)
+    # set once that DDL has been committed, after which no connection needs it again
+    _artifacts_ready: bool = field(default=False, init=False, repr=False)
+    _pool: Optional[ConnectionPool] = field(default=None, init=False, repr=False)
+    _conninfo: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._conninfo = make_conninfo(**self._connection_kwargs())
 
     def _connection_kwargs(self) -> Dict[str, object]:
         kwargs: Dict[str, object] = {
@@ -35,23 +52,51 @@ class DatabaseRepository:
             kwargs["sslmode"] = self.settings.sslmode
         return kwargs
 
+    def _get_pool(self) -> ConnectionPool:
+        """Return the shared connection pool, opening it on first use."""
+
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                conninfo=self._conninfo,
+                min_size=1,
+                max_size=4,
+                kwargs={"row_factory": dict_row},
+                open=True,
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Close the connection pool, if one was opened."""
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
     @contextmanager
     def connection(self) -> Iterator[Connection]:
-        """Context manager returning a psycopg connection with transaction handling."""
-
-        conn = connect(**self._connection_kwargs())
-        try:
-            yield conn
-            conn.commit()
-        except Exception:  # pragma: no cover - defensive rollback
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager returning a pooled psycopg connection with transaction handling."""
+
+        with self._get_pool().connection() as conn:
+            try:
+                yield conn
+                conn.commit()
+                if id(conn) in self._artifacts_checked:
+                    self._artifacts_ready = True
+            except Exception:  # pragma: no cover - defensive rollback
+                conn.rollback()
+                raise
+            finally:
+                self._artifacts_checked.discard(id(conn))
 
     def _ensure_artifacts_column(self, conn: Connection) -> None:
-        """Ensure auxiliary metadata columns exist (idempotent)."""
+        """Ensure auxiliary metadata columns exist (idempotent).
 
+        The DDL runs at most once per transaction and is skipped entirely once a
+        transaction that ran it has committed.
+        """
+
+        if self._artifacts_ready or id(conn) in self._artifacts_checked:
+            return
         with conn.cursor() as cur:
             cur.execute(
                 """
@@ -59,6 +104,7 @@ class DatabaseRepository:
                 ADD COLUMN IF NOT EXISTS artifacts JSONB
                 """
             )
+        self._artifacts_checked.add(id(conn))
 
     def create_dataset_version(
         self,
@@ -82,6 +128,7 @@ class DatabaseRepository:
                 RETURNING id
                 """,
                 (version_name, year, source_uri, status),
+                prepare=True,
             )
             row = cur.fetchone()
             if not row:  # pragma: no cover - should not happen
@@ -96,39 +143,28 @@ class DatabaseRepository:
         table: pa.Table,
         only_valid: bool = True,
     ) -> int:
-        """Bulk-copy normalized records into flights_raw staging table."""
+        """Bulk-copy normalized records into flights_raw staging table.
 
-        df = pl.from_arrow(table) if not isinstance(table, pl.DataFrame) else table
-        if df.is_empty():
-            return 0
-        if only_valid and "superseded" in df.columns:
-            df = df.filter(~pl.col("superseded"))
-        if df.is_empty():
+        Rows are rendered to COPY CSV by Polars chunk by chunk, so no Python code runs per row.
+        """
+
+        table = _stageable_rows(table, "flight_id", "start_time_utc", only_valid=only_valid)
+        if table.num_rows == 0:
             return 0
+        frame = pl.from_arrow(table).select(
+            pl.lit(dataset_version_id, dtype=pl.Int64).alias("dataset_version_id"),
+            pl.col("flight_id"),
+            pl.col("start_time_utc").dt.date().alias("event_date"),
+            pl.struct(pl.all()).struct.json_encode().alias("payload"),
+        )
 
-        count = 0
         with conn.cursor() as cur:
+            _relax_commit_durability(cur)
             with cur.copy(
-                "COPY flights_raw (dataset_version_id, flight_external_id, event_date, payload) FROM STDIN"
+                "COPY flights_raw (dataset_version_id, flight_external_id, event_date, payload) "
+                f"FROM STDIN {_COPY_CSV_OPTIONS}"
             ) as copy:
-                for row in df.iter_rows(named=True):
-                    flight_id = row.get("flight_id")
-                    if flight_id is None:
-                        continue
-                    start: datetime | None = row.get("start_time_utc")
-                    if start is None:
-                        continue
-                    payload = _serialize_payload(row)
-                    copy.write_row(
-                        (
-                            dataset_version_id,
-                            flight_id,
-                            start.date(),
-                            Jsonb(payload),
-                        )
-                    )
-                    count += 1
-        return count
+                return _write_csv_chunks(copy, frame)
 
     def upsert_flights_norm(
         self,
@@ -139,36 +175,28 @@ class DatabaseRepository:
     ) -> int:
         """Bulk insert normalized records into flights_norm table."""
 
-        df = pl.from_arrow(table) if not isinstance(table, pl.DataFrame) else table
-        if df.is_empty():
-            return 0
-        if "superseded" in df.columns:
-            df = df.filter(~pl.col("superseded"))
-        if df.is_empty():
+        table = _stageable_rows(table, "start_time_utc")
+        if table.num_rows == 0:
             return 0
+        frame = pl.from_arrow(table).select(
+            pl.lit(dataset_version_id, dtype=pl.Int64).alias("dataset_version_id"),
+            pl.lit(None, dtype=pl.Int64).alias("region_id"),
+            "flight_id",
+            "start_time_utc",
+            "end_time_utc",
+            # Polars renders inf/NaN as text, which NUMERIC(10,2) would reject mid-COPY
+            pl.when(pl.col("duration_minutes").is_finite())
+            .then(pl.col("duration_minutes"))
+            .alias("duration_minutes"),
+        )
 
-        count = 0
         with conn.cursor() as cur:
+            _relax_commit_durability(cur)
             with cur.copy(
-                "COPY flights_norm (dataset_version_id, region_id, flight_uid, departure_time, arrival_time, duration_minutes) "
-                "FROM STDIN"
+                "COPY flights_norm (dataset_version_id, region_id, flight_uid, departure_time, "
+                f"arrival_time, duration_minutes) FROM STDIN {_COPY_CSV_OPTIONS}"
             ) as copy:
-                for row in df.iter_rows(named=True):
-                    start: datetime | None = row.get("start_time_utc")
-                    if start is None:
-                        continue
-                    copy.write_row(
-                        (
-                            dataset_version_id,
-                            None,
-                            row.get("flight_id"),
-                            start,
-                            row.get("end_time_utc"),
-                            row.get("duration_minutes"),
-                        )
-                    )
-                    count += 1
-        return count
+                return _write_csv_chunks(copy, frame)
 
     def mark_ingested(
         self,
@@ -191,19 +219,53 @@ class DatabaseRepository:
                        artifacts = %s
                  WHERE id = %s
                 """,
-                (checksum, Jsonb(artifacts), dataset_version_id),
+                (checksum, Jsonb(artifacts, dumps=orjson.dumps), dataset_version_id),
+                prepare=True,
             )
 
 
-def _serialize_payload(row: dict[str, object]) -> Dict[str, object]:
-    """Convert row values to JSON-serialisable types."""
+def _relax_commit_durability(cur: Cursor) -> None:
+    """Skip the WAL flush wait when the staging transaction commits.
+
+    A crash may lose the last staged rows, but never leaves partial data visible: downstream
+    consumers only read versions that ``mark_ingested`` flagged in the same transaction, and
+    the ingest is re-runnable from its source.
+    """
+
+    cur.execute("SET LOCAL synchronous_commit = off")
+
+
+def _stageable_rows(
+    table: pa.Table | pl.DataFrame, *required: str, only_valid: bool = True
+) -> pa.Table:
+    """Return the Arrow rows eligible for COPY: not superseded and with ``required`` set."""
+
+    if isinstance(table, pl.DataFrame):
+        table = table.to_arrow()
+    if table.num_rows == 0:
+        return table
+    mask = None
+    if only_valid and "superseded" in table.column_names:
+        mask = pc.invert(pc.fill_null(table.column("superseded"), False))
+    for name in required:
+        valid = pc.is_valid(table.column(name))
+        mask = valid if mask is None else pc.and_(mask, valid)
+    return table.filter(mask) if mask is not None else table
+
+
+def _write_csv_chunks(copy: Copy, frame: pl.DataFrame) -> int:
+    """Stream ``frame`` into ``copy`` as tab-separated CSV, one Polars-encoded chunk at a time."""
 
-    payload: Dict[str, object] = {}
-    for key, value in row.items():
-        if isinstance(value, datetime):
-            payload[key] = value.isoformat()
-        elif isinstance(value, date):
-            payload[key] = value.isoformat()
-        else:
-            payload[key] = value
-    return payload
+    buffer = io.BytesIO()
+    for chunk in frame.iter_slices(_COPY_CHUNK):
+        buffer.seek(0)
+        buffer.truncate()
+        chunk.write_csv(
+            buffer,
+            include_header=False,
+            separator="\t",
+            null_value=_COPY_NULL,
+            datetime_format="%Y-%m-%d %H:%M:%S%.f%:z",
+        )
+        copy.write(buffer.getbuffer())
+    return frame.height
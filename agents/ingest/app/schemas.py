@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, Iterable, MutableMapping, TypedDict
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, TypedDict
 
 from .utils import normalize_header
 
@@ -116,17 +117,15 @@ def build_reverse_column_map() -> Dict[str, str]:
     return reverse
 
 
-REVERSE_COLUMN_MAP: Dict[str, str] = build_reverse_column_map()
-"""Normalized alias → canonical column lookup map."""
+REVERSE_COLUMN_MAP: Mapping[str, str] = MappingProxyType(build_reverse_column_map())
+"""Normalized alias → canonical column lookup map (read-only)."""
 
 
 def normalize_columns(columns: Iterable[str]) -> Dict[str, str]:
     """Return a rename mapping converting arbitrary columns to canonical ones."""
 
-    mapping: MutableMapping[str, str] = {}
-    for name in columns:
-        normalized = normalize_header(name)
-        canonical = REVERSE_COLUMN_MAP.get(normalized)
-        if canonical:
-            mapping[name] = canonical
-    return dict(mapping)
+    return {
+        name: canonical
+        for name in columns
+        if (canonical := REVERSE_COLUMN_MAP.get(normalize_header(name)))
+    }
@@ -3,19 +3,35 @@
 from __future__ import annotations
 
 import io
-import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Optional, Sequence, Tuple
 
 import boto3
+import orjson
 import polars as pl
 import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pyarrow.parquet as pq
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
 from .config import AppSettings, MinioSettings, StorageSettings
 
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 << 20,
+    max_concurrency=8,
+    max_io_queue=1000,
+    use_threads=True,
+)
+
+# Parquet output stays in memory up to this size before spilling to a temporary file
+_PARQUET_SPOOL_SIZE = 64 << 20
+
+UploadJob = Tuple[bytes | BinaryIO, str, str]
+"""Object body (bytes or a rewound binary buffer), key and content type of a single upload."""
+
 
 @dataclass(slots=True)
 class StorageClient:
@@ -23,6 +39,10 @@ class StorageClient:
 
     minio: MinioSettings
     storage: StorageSettings
+    client: Any = field(init=False, repr=False)
+    bucket: str = field(init=False)
+    prefix: str = field(init=False)
+    transfer: Any = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         session = boto3.session.Session()
@@ -37,6 +57,8 @@ class StorageClient:
             use_ssl=use_ssl,
             config=Config(signature_version="s3v4"),
         )
+        # one transfer manager (and its worker pool) is shared by every batched upload
+        self.transfer = create_transfer_manager(self.client, _TRANSFER_CONFIG)
         self.bucket = self.minio.bucket or self.storage.dataset_bucket or "datasets"
         self.prefix = (self.storage.dataset_prefix or "datasets").strip("/")
         self._ensure_bucket()
@@ -45,6 +67,11 @@ class StorageClient:
     def from_settings(cls, settings: AppSettings) -> "StorageClient":
         return cls(settings.minio, settings.storage)
 
+    def close(self) -> None:
+        """Shut down the shared transfer manager and its worker threads."""
+
+        self.transfer.shutdown()
+
     def _normalize_endpoint(self, endpoint: Optional[str]) -> str:
         if not endpoint:
             return ""
@@ -101,16 +128,27 @@ class StorageClient:
             arrow_table = table.to_arrow()
         else:
             arrow_table = table
-        buffer = io.BytesIO()
-        pq.write_table(arrow_table, buffer)
-        buffer.seek(0)
         key = self.build_object_key(year, version, name, "parquet", prefix=prefix)
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=buffer.getvalue(),
-            ContentType="application/x-parquet",
-        )
+        # row groups are written one at a time into a spooled buffer, which boto3 then sends
+        # as multipart parts through the same client (and config) as every other upload
+        with tempfile.SpooledTemporaryFile(max_size=_PARQUET_SPOOL_SIZE) as spool:
+            with pq.ParquetWriter(
+                spool,
+                arrow_table.schema,
+                compression="zstd",
+                compression_level=7,
+                use_dictionary=True,
+                write_statistics=True,
+            ) as writer:
+                writer.write_table(arrow_table, row_group_size=50_000)
+            spool.seek(0)
+            self.client.upload_fileobj(
+                spool,
+                self.bucket,
+                key,
+                ExtraArgs={"ContentType": "application/x-parquet"},
+                Config=_TRANSFER_CONFIG,
+            )
         return f"s3://{self.bucket}/{key}"
 
     def upload_csv(
@@ -122,15 +160,12 @@ class StorageClient:
         *,
         prefix: Optional[str] = None,
     ) -> str:
-        df = data if isinstance(data, pl.DataFrame) else pl.from_arrow(data)
-        buffer = io.StringIO()
-        df.write_csv(buffer, has_header=True)
         key = self.build_object_key(year, version, name, "csv", prefix=prefix)
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=buffer.getvalue().encode("utf-8"),
-            ContentType="text/csv",
+        self.client.upload_fileobj(
+            self.encode_csv(data),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": "text/csv"},
         )
         return f"s3://{self.bucket}/{key}"
 
@@ -144,11 +179,46 @@ class StorageClient:
         prefix: Optional[str] = None,
     ) -> str:
         key = self.build_object_key(year, version, name, "json", prefix=prefix)
-        body = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
         self.client.put_object(
             Bucket=self.bucket,
             Key=key,
-            Body=body,
+            Body=self.encode_json(payload),
             ContentType="application/json",
         )
         return f"s3://{self.bucket}/{key}"
+
+    def upload_many(self, jobs: Sequence[UploadJob]) -> list[str]:
+        """Upload several objects concurrently through the shared transfer manager."""
+
+        futures = [
+            self.transfer.upload(
+                io.BytesIO(body) if isinstance(body, bytes) else body,
+                self.bucket,
+                key,
+                extra_args={"ContentType": content_type},
+            )
+            for body, key, content_type in jobs
+        ]
+        for future in futures:
+            future.result()
+        return [f"s3://{self.bucket}/{key}" for _, key, _ in jobs]
+
+    @staticmethod
+    def encode_csv(data: pa.Table | pl.DataFrame) -> io.BytesIO:
+        """Render ``data`` as CSV into a rewound in-memory buffer, without a ``str`` copy."""
+
+        buffer = io.BytesIO()
+        if isinstance(data, pa.Table):
+            # Arrow input is written by pyarrow directly instead of via a Polars copy
+            pa_csv.write_csv(data, buffer, write_options=pa_csv.WriteOptions(include_header=True))
+        else:
+            data.write_csv(buffer, include_header=True)
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def encode_json(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import MagicMock
 
 import logging
 
@@ -83,3 +84,27 @@ def test_ingest_command_invokes_pipeline(monkeypatch, caplog) -> None:  # type:
     messages = [record.getMessage() for record in caplog.records]
     assert "Starting ingest command" in messages
     assert "Finished ingest command" in messages
+
+
+def test_ingest_command_closes_pipeline(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    closed: list[IngestPipeline] = []
+
+    monkeypatch.setattr(IngestPipeline, "run", lambda self, source, **_: None)
+    monkeypatch.setattr(IngestPipeline, "close", lambda self: closed.append(self))
+
+    result = runner.invoke(app, ["ingest", "rosaviatsia", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert len(closed) == 1
+
+
+def test_pipeline_close_releases_created_clients() -> None:
+    pipeline = IngestPipeline()
+    repository, storage = MagicMock(), MagicMock()
+    pipeline.__dict__.update(repository=repository, storage=storage)
+
+    pipeline.close()
+    pipeline.close()
+
+    repository.close.assert_called_once_with()
+    storage.close.assert_called_once_with()
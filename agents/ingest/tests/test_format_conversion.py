@@ -7,7 +7,7 @@ import pytest
 pd = pytest.importorskip("pandas")
 pl = pytest.importorskip("polars")
 
-from app.formats import detect_format, load_records
+from app.formats import detect_format, load_records, load_records_many
 
 SAMPLES_DIR = Path(__file__).resolve().parents[2] / "samples"
 
@@ -86,3 +86,28 @@ def test_load_html(tmp_path: Path) -> None:
     assert result.metadata["report_timezone"] == "Europe/Moscow"
     assert "flight_id" in result.records.columns
     assert result.records.height == 1
+
+
+def test_load_html_square_table_keeps_row_orientation(tmp_path: Path) -> None:
+    path = tmp_path / "square.html"
+    path.write_text(
+        "<table><tr><th>Flight Id</th><th>Duration</th></tr>"
+        "<tr><td>RU-1</td><td>12</td></tr><tr><td>RU-2</td><td>34</td></tr></table>"
+    )
+    records = load_records(path).records
+    assert records["flight_id"].to_list() == ["RU-1", "RU-2"]
+    assert records.schema["flight_id"] == pl.Utf8
+
+
+def test_load_records_many_preserves_order(tmp_path: Path) -> None:
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"part_{idx}.csv"
+        path.write_text(f"flight_id,duration_minutes\nRU-{idx},\"1{idx},5\"\n")
+        paths.append(path)
+
+    results = load_records_many(paths, max_workers=2)
+
+    assert [result.metadata["source_path"] for result in results] == [str(p) for p in paths]
+    assert [result.records["flight_id"][0] for result in results] == ["RU-0", "RU-1", "RU-2"]
+    assert results[1].records["duration_minutes"][0] == "11.5"
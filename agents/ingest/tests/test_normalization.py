@@ -72,3 +72,22 @@ def test_normalize_records_handles_timezone_duration_and_dedup() -> None:
     assert normalized.filter(pl.col("latitude").is_null()).height == 0
     assert normalized.filter(pl.col("longitude").is_null()).height == 0
     assert normalized.filter(pl.col("flight_id") == "A2").height == 0
+
+
+def test_normalize_records_parses_dotted_dates_like_pendulum() -> None:
+    raw = pl.DataFrame(
+        {
+            "flight_id": ["D1"],
+            "start_time": ["02.01.2024 10:00"],
+            "end_time": ["02.01.2024 11:00"],
+            "region_code": ["RU-MOW"],
+            "region_name": ["Москва"],
+            "latitude": ["55.75"],
+            "longitude": ["37.61"],
+        }
+    )
+
+    table, _ = normalize_records(FormatReadResult(records=raw, metadata={}))
+
+    start_utc = pl.from_arrow(table)["start_time_utc"][0]
+    assert start_utc.isoformat().startswith("2024-02-01T10:00")
@@ -12,6 +12,7 @@ from psycopg.rows import dict_row
 from typer.testing import CliRunner
 
 from app.cli import app
+from app.config import get_settings
 
 SAMPLES_ROOT = Path(__file__).resolve().parents[3] / "samples"
 SAMPLE_FILE = SAMPLES_ROOT / "rosaviation_sample.csv"
@@ -53,6 +54,7 @@ def test_full_pipeline_ingest(monkeypatch, migrated_db):  # type: ignore[no-unty
     monkeypatch.setenv("MINIO_SECURE", "true")
     monkeypatch.setenv("MINIO_REGION", "us-east-1")
     monkeypatch.setenv("STORAGE__DATASET_PREFIX", "datasets")
+    get_settings.cache_clear()
 
     dataset_version = "test-version"
 
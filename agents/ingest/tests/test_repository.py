@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pl = pytest.importorskip("polars")
+
+from app.config import PostgresSettings
+from app.repository import DatabaseRepository, _stageable_rows, _write_csv_chunks
+
+
+class FakeCopy:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: memoryview) -> None:
+        self.chunks.append(bytes(data))
+
+
+def test_stageable_rows_drops_superseded_and_incomplete_rows() -> None:
+    start = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+    table = pa.table(
+        {
+            "flight_id": ["A", "B", None, "D"],
+            "start_time_utc": [start, start, start, None],
+            "superseded": [False, True, None, False],
+        }
+    )
+
+    staged = _stageable_rows(table, "flight_id", "start_time_utc")
+    assert staged.column("flight_id").to_pylist() == ["A"]
+    assert _stageable_rows(table, "start_time_utc", only_valid=False).num_rows == 3
+
+
+def test_write_csv_chunks_streams_copy_csv_chunks() -> None:
+    frame = pl.DataFrame({"flight_id": ["A", None, "C"], "n": [1, 2, None]})
+    copy = FakeCopy()
+
+    assert _write_csv_chunks(copy, frame) == 3  # type: ignore[arg-type]
+    assert b"".join(copy.chunks).decode().splitlines() == ["A\t1", "\\N\t2", "C\t\\N"]
+
+
+def test_upsert_flights_norm_nulls_non_finite_durations() -> None:
+    start = datetime(2024, 1, 1, 10, 30, tzinfo=timezone.utc)
+    table = pa.table(
+        {
+            "flight_id": ["A", "B", "C"],
+            "start_time_utc": [start, start, start],
+            "end_time_utc": [None, None, None],
+            "duration_minutes": [45.5, float("inf"), float("nan")],
+        }
+    )
+    copy = FakeCopy()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.copy.return_value.__enter__.return_value = copy
+    repository = DatabaseRepository(PostgresSettings())
+
+    assert repository.upsert_flights_norm(conn, dataset_version_id=7, table=table) == 3
+    assert b"".join(copy.chunks).decode().splitlines() == [
+        "7\t\\N\tA\t2024-01-01 10:30:00+00:00\t\\N\t45.5",
+        "7\t\\N\tB\t2024-01-01 10:30:00+00:00\t\\N\t\\N",
+        "7\t\\N\tC\t2024-01-01 10:30:00+00:00\t\\N\t\\N",
+    ]
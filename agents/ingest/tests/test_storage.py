@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+moto = pytest.importorskip("moto")
+
+from app.config import AppSettings
+from app.storage import StorageClient
+
+
+def test_upload_parquet_goes_through_boto3_client(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setenv("MINIO_ENDPOINT", "")
+    monkeypatch.setenv("MINIO_BUCKET", "ingest-test")
+    table = pa.table({"flight_id": [f"F{i}" for i in range(120_000)], "n": range(120_000)})
+
+    with moto.mock_aws():
+        storage = StorageClient.from_settings(AppSettings())
+        uri = storage.upload_parquet(2024, "v1", "normalized", table)
+
+        key = "datasets/2024/v1/normalized.parquet"
+        assert uri == f"s3://ingest-test/{key}"
+        obj = storage.client.get_object(Bucket="ingest-test", Key=key)
+        assert obj["ContentType"] == "application/x-parquet"
+        parquet = pq.ParquetFile(io.BytesIO(obj["Body"].read()))
+
+    assert parquet.metadata.num_rows == table.num_rows
+    assert parquet.num_row_groups == 3
+    assert parquet.read().equals(table)
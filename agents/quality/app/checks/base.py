@@ -31,9 +31,14 @@ class DataCheck(Protocol):
     """Common protocol implemented by all checks."""
 
     name: str
+    required_columns: frozenset[str] = frozenset({"*"})
+    """Columns read by :meth:`run`, used to project the loaded table; ``"*"`` means all."""
 
     def run(self, data: pd.DataFrame) -> CheckResult:
-        """Validate ``data`` and return the :class:`CheckResult`."""
+        """Validate ``data`` and return the :class:`CheckResult`.
+
+        Checks may run concurrently over the same frame, so ``data`` must not be mutated.
+        """
 
 
 __all__ = ["CheckStatus", "CheckResult", "DataCheck"]
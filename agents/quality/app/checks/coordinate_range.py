@@ -2,21 +2,36 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 from .base import CheckResult, CheckStatus, DataCheck
-from .utils import dataframe_to_records
+from .utils import SAMPLE_KEY_COLUMNS, dataframe_to_records
+
+
+@dataclass(frozen=True, slots=True)
+class CoordinateRangeSummary:
+    """Out-of-bounds coordinates counted outside the check over ``row_count`` rows."""
+
+    row_count: int
+    invalid_count: int
+    sample_rows: list[dict[str, Any]] = field(default_factory=list)
 
 
 class CoordinateRangeCheck(DataCheck):
     """Ensure latitude and longitude stay within geographic bounds."""
 
     name = "coordinate_range"
+    required_columns = SAMPLE_KEY_COLUMNS | {"latitude", "longitude"}
+
+    def run(self, data: pd.DataFrame, summary: CoordinateRangeSummary | None = None) -> CheckResult:
+        """Validate coordinates, reusing ``summary`` when it was computed for this frame."""
 
-    def run(self, data: pd.DataFrame) -> CheckResult:
         lat = data.get("latitude")
         lon = data.get("longitude")
-        detail = {}
 
         if lat is None or lon is None:
             return CheckResult(
@@ -25,21 +40,32 @@ class CoordinateRangeCheck(DataCheck):
                 summary="latitude/longitude columns not available",
             )
 
-        invalid = data[
-            (lat.notna() & ((lat < -90) | (lat > 90)))
-            | (lon.notna() & ((lon < -180) | (lon > 180)))
-        ]
+        if summary is not None and self.accepts(summary, data):
+            return self._result(summary.invalid_count, summary.sample_rows)
+
+        # NaN compares False, so missing coordinates never count as out of range
+        lat_arr = lat.to_numpy(dtype=np.float64, na_value=np.nan)
+        lon_arr = lon.to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = (lat_arr < -90) | (lat_arr > 90) | (lon_arr < -180) | (lon_arr > 180)
+
+        invalid_count = int(mask.sum())
+        sample_rows = dataframe_to_records(data.iloc[mask]) if invalid_count else []
+        return self._result(invalid_count, sample_rows)
+
+    def accepts(self, summary: CoordinateRangeSummary, data: pd.DataFrame) -> bool:
+        """Return whether ``summary`` was computed over ``data``."""
+
+        return summary.row_count == len(data)
 
-        if invalid.empty:
+    def _result(self, invalid_count: int, sample_rows: list[dict[str, Any]]) -> CheckResult:
+        detail: dict[str, Any] = {}
+        if not invalid_count:
             summary = "coordinates fall within expected bounds"
             status = CheckStatus.OK
         else:
             status = CheckStatus.FAIL
-            summary = f"found {invalid.shape[0]} coordinates outside geographic bounds"
-            detail = {
-                "invalid_count": int(invalid.shape[0]),
-                "sample_rows": dataframe_to_records(invalid),
-            }
+            summary = f"found {invalid_count} coordinates outside geographic bounds"
+            detail = {"invalid_count": invalid_count, "sample_rows": sample_rows}
 
         return CheckResult(name=self.name, status=status, summary=summary, details=detail or None)
 
@@ -50,4 +76,8 @@ def build_coordinate_range_check() -> CoordinateRangeCheck:
     return CoordinateRangeCheck()
 
 
-__all__ = ["CoordinateRangeCheck", "build_coordinate_range_check"]
+__all__ = [
+    "CoordinateRangeCheck",
+    "CoordinateRangeSummary",
+    "build_coordinate_range_check",
+]
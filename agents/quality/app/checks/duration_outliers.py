@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from .base import CheckResult, CheckStatus, DataCheck
-from .utils import dataframe_to_records
+from .utils import SAMPLE_KEY_COLUMNS, dataframe_to_records
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+if njit is not None:
+
+    # serial on purpose: numba's parallel workqueue layer is not safe to enter from the
+    # concurrent check threads, and one compare per element is memory-bound anyway
+    @njit(cache=True)
+    def _iqr_mask_kernel(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+        out = np.zeros(values.size, dtype=np.uint8)
+        for i in range(values.size):
+            # NaN fails both comparisons, so missing durations stay unflagged
+            if values[i] < lower or values[i] > upper:
+                out[i] = 1
+        return out
+
+
+def _iqr_mask(values: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """Return a boolean mask of ``values`` outside ``[lower, upper]``."""
+
+    if njit is None:
+        return (values < lower) | (values > upper)
+    return _iqr_mask_kernel(values, float(lower), float(upper)).view(np.bool_)
 
 
 class DurationOutlierCheck(DataCheck):
     """Identify unusually long or short flights."""
 
     name = "duration_outliers"
+    required_columns = SAMPLE_KEY_COLUMNS | {"duration_minutes"}
 
     def run(self, data: pd.DataFrame) -> CheckResult:
         if "duration_minutes" not in data.columns:
@@ -21,27 +50,29 @@ class DurationOutlierCheck(DataCheck):
                 summary="duration_minutes column missing",
             )
 
-        durations = data["duration_minutes"].dropna()
-        if durations.empty:
+        values = data["duration_minutes"].to_numpy(dtype=np.float64, na_value=np.nan)
+        durations = values[~np.isnan(values)]
+        if not durations.size:
             return CheckResult(
                 name=self.name,
                 status=CheckStatus.WARN,
                 summary="no duration values available for outlier detection",
             )
 
-        q1 = durations.quantile(0.25)
-        q3 = durations.quantile(0.75)
+        # one partition pass yields both quartiles (linear interpolation, as Series.quantile)
+        q1, q3 = np.percentile(durations, [25, 75])
         iqr = q3 - q1
         lower = q1 - 1.5 * iqr
         upper = q3 + 1.5 * iqr
 
-        outliers = data[(data["duration_minutes"] < lower) | (data["duration_minutes"] > upper)]
+        mask = _iqr_mask(values, lower, upper)
+        outlier_count = int(mask.sum())
         detail = {
             "thresholds": {"lower": float(lower), "upper": float(upper)},
-            "outlier_count": int(outliers.shape[0]),
+            "outlier_count": outlier_count,
         }
 
-        if outliers.empty:
+        if not outlier_count:
             return CheckResult(
                 name=self.name,
                 status=CheckStatus.OK,
@@ -49,11 +80,11 @@ class DurationOutlierCheck(DataCheck):
                 details=detail,
             )
 
-        detail["sample_rows"] = dataframe_to_records(outliers)
+        detail["sample_rows"] = dataframe_to_records(data.iloc[np.flatnonzero(mask)[:5]])
         return CheckResult(
             name=self.name,
             status=CheckStatus.WARN,
-            summary=f"detected {outliers.shape[0]} potential duration outliers",
+            summary=f"detected {outlier_count} potential duration outliers",
             details=detail,
         )
 
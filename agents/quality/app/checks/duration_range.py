@@ -2,22 +2,51 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 from .base import CheckResult, CheckStatus, DataCheck
-from .utils import dataframe_to_records
+from .utils import SAMPLE_KEY_COLUMNS, dataframe_to_records
+
+DEFAULT_MINIMUM_MINUTES = 1.0
+DEFAULT_MAXIMUM_MINUTES = 24 * 60
+
+
+@dataclass(frozen=True, slots=True)
+class DurationRangeSummary:
+    """Out-of-range durations counted outside the check, e.g. by the fused pipeline scan.
+
+    ``row_count`` is the number of rows the summary was computed over; the check only trusts
+    a summary whose bounds and row count match the frame it is given.
+    """
+
+    minimum: float
+    maximum: float
+    row_count: int
+    invalid_count: int
+    sample_rows: list[dict[str, Any]] = field(default_factory=list)
 
 
 class DurationRangeCheck(DataCheck):
     """Ensure flight durations fall within realistic boundaries."""
 
     name = "duration_range"
+    required_columns = SAMPLE_KEY_COLUMNS | {"duration_minutes"}
 
-    def __init__(self, minimum: float = 1.0, maximum: float = 24 * 60) -> None:
+    def __init__(
+        self,
+        minimum: float = DEFAULT_MINIMUM_MINUTES,
+        maximum: float = DEFAULT_MAXIMUM_MINUTES,
+    ) -> None:
         self.minimum = minimum
         self.maximum = maximum
 
-    def run(self, data: pd.DataFrame) -> CheckResult:
+    def run(self, data: pd.DataFrame, summary: DurationRangeSummary | None = None) -> CheckResult:
+        """Validate durations, reusing ``summary`` when it was computed for this frame."""
+
         if "duration_minutes" not in data.columns:
             return CheckResult(
                 name=self.name,
@@ -25,23 +54,41 @@ class DurationRangeCheck(DataCheck):
                 summary="duration_minutes column missing",
             )
 
-        durations = data["duration_minutes"].dropna()
-        below = durations < self.minimum
-        above = durations > self.maximum
-        invalid_rows = data[below | above]
-        detail = {
+        if summary is not None and self.accepts(summary, data):
+            return self._result(summary.invalid_count, summary.sample_rows)
+
+        durations = data["duration_minutes"].to_numpy(dtype=np.float64, na_value=np.nan)
+        # NaN compares False on both sides, so missing durations are never flagged
+        mask = (durations < self.minimum) | (durations > self.maximum)
+        invalid_count = int(mask.sum())
+        sample_rows = (
+            dataframe_to_records(data.iloc[np.flatnonzero(mask)[:5]]) if invalid_count else []
+        )
+        return self._result(invalid_count, sample_rows)
+
+    def accepts(self, summary: DurationRangeSummary, data: pd.DataFrame) -> bool:
+        """Return whether ``summary`` used this check's bounds and was computed over ``data``."""
+
+        return (
+            summary.minimum == self.minimum
+            and summary.maximum == self.maximum
+            and summary.row_count == len(data)
+        )
+
+    def _result(self, invalid_count: int, sample_rows: list[dict[str, Any]]) -> CheckResult:
+        detail: dict[str, Any] = {
             "minimum": self.minimum,
             "maximum": self.maximum,
-            "invalid_count": int(invalid_rows.shape[0]),
+            "invalid_count": invalid_count,
         }
 
-        if invalid_rows.empty:
+        if not invalid_count:
             summary = "all durations within expected range"
             status = CheckStatus.OK
         else:
             status = CheckStatus.FAIL
-            summary = f"found {invalid_rows.shape[0]} durations outside range"
-            detail["sample_rows"] = dataframe_to_records(invalid_rows)
+            summary = f"found {invalid_count} durations outside range"
+            detail["sample_rows"] = sample_rows
 
         return CheckResult(name=self.name, status=status, summary=summary, details=detail)
 
@@ -52,4 +99,10 @@ def build_duration_range_check() -> DurationRangeCheck:
     return DurationRangeCheck()
 
 
-__all__ = ["DurationRangeCheck", "build_duration_range_check"]
+__all__ = [
+    "DEFAULT_MAXIMUM_MINUTES",
+    "DEFAULT_MINIMUM_MINUTES",
+    "DurationRangeCheck",
+    "DurationRangeSummary",
+    "build_duration_range_check",
+]
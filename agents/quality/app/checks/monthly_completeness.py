@@ -5,12 +5,14 @@ from __future__ import annotations
 import pandas as pd
 
 from .base import CheckResult, CheckStatus, DataCheck
+from .utils import SAMPLE_KEY_COLUMNS, dataframe_to_records
 
 
 class MonthlyCompletenessCheck(DataCheck):
     """Ensure each year contains a contiguous sequence of months."""
 
     name = "monthly_completeness"
+    required_columns = SAMPLE_KEY_COLUMNS | {"start_time_utc"}
 
     def run(self, data: pd.DataFrame) -> CheckResult:
         if "start_time_utc" not in data.columns:
@@ -20,7 +22,10 @@ class MonthlyCompletenessCheck(DataCheck):
                 summary="start_time_utc column missing",
             )
 
-        timestamps = pd.to_datetime(data["start_time_utc"], errors="coerce")
+        timestamps = data["start_time_utc"]
+        if timestamps.dtype.kind != "M":
+            # run_pipeline parses the column up front unless some value fails to parse
+            timestamps = pd.to_datetime(timestamps, errors="coerce", format="ISO8601")
         invalid_dates = data[timestamps.isna()]
         if not invalid_dates.empty:
             return CheckResult(
@@ -29,19 +34,20 @@ class MonthlyCompletenessCheck(DataCheck):
                 summary="invalid datetimes in start_time_utc",
                 details={
                     "invalid_count": int(invalid_dates.shape[0]),
-                    "sample_rows": invalid_dates.head(5).to_dict(orient="records"),
+                    "sample_rows": dataframe_to_records(invalid_dates),
                 },
             )
 
-        months = timestamps.dt.month
-        years = timestamps.dt.year
+        observed_months = (
+            pd.DataFrame({"year": timestamps.dt.year, "month": timestamps.dt.month})
+            .groupby("year", sort=True)["month"]
+            .unique()
+        )
         detail: dict[str, list[int]] = {}
         warnings: dict[int, list[int]] = {}
 
-        for year in sorted(years.unique()):
-            year_months = sorted(months[years == year].unique())
-            if not year_months:
-                continue
+        for year, months in observed_months.items():
+            year_months = sorted(months)
             expected = set(range(min(year_months), max(year_months) + 1))
             missing = sorted(expected.difference(year_months))
             if missing:
@@ -15,17 +15,21 @@ class SchemaCheck(DataCheck):
     """Verify the dataframe adheres to the canonical schema."""
 
     name = "schema"
-    _required_columns = {
-        "flight_id",
-        "start_time_utc",
-        "end_time_utc",
-        "duration_minutes",
-    }
-    _expected_columns = set(CANONICAL_ORDER)
+    _required_columns = frozenset(
+        {
+            "flight_id",
+            "start_time_utc",
+            "end_time_utc",
+            "duration_minutes",
+        }
+    )
+    _expected_columns = frozenset(CANONICAL_ORDER)
+    required_columns = _expected_columns
 
     def run(self, data: pd.DataFrame) -> CheckResult:
-        missing_columns = sorted(self._expected_columns.difference(data.columns))
-        unexpected_columns = sorted(set(data.columns).difference(self._expected_columns))
+        columns = set(data.columns)
+        missing_columns = sorted(self._expected_columns.difference(columns))
+        unexpected_columns = sorted(columns.difference(self._expected_columns))
 
         detail: dict[str, Any] = {}
         status = CheckStatus.OK
@@ -42,12 +46,10 @@ class SchemaCheck(DataCheck):
                 status = CheckStatus.WARN
             messages.append("found unexpected columns")
 
-        null_counts = {
-            column: int(data[column].isna().sum())
-            for column in self._required_columns
-            if column in data.columns
-        }
-        null_violations = {col: count for col, count in null_counts.items() if count > 0}
+        # one isna() pass over the present required columns yields every null count
+        present_required = [column for column in self._required_columns if column in columns]
+        null_counts = data[present_required].isna().sum()
+        null_violations = {col: int(count) for col, count in null_counts.items() if count > 0}
         if null_violations:
             status = CheckStatus.FAIL
             detail["null_counts"] = null_violations
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from .base import CheckResult, CheckStatus, DataCheck
-from .utils import dataframe_to_records
+from .utils import SAMPLE_KEY_COLUMNS, dataframe_to_records
 
 
 class UniquenessCheck(DataCheck):
@@ -13,6 +14,7 @@ class UniquenessCheck(DataCheck):
 
     name = "uniqueness"
     _key_columns = ("flight_id", "start_time_utc", "region_code")
+    required_columns = SAMPLE_KEY_COLUMNS.union(_key_columns)
 
     def run(self, data: pd.DataFrame) -> CheckResult:
         missing = [col for col in self._key_columns if col not in data.columns]
@@ -23,9 +25,27 @@ class UniquenessCheck(DataCheck):
                 summary=f"missing key columns: {', '.join(missing)}",
             )
 
-        duplicates = data.duplicated(subset=list(self._key_columns), keep=False)
-        duplicate_rows = data[duplicates]
-        if duplicate_rows.empty:
+        # a single hash pass assigns group codes; rows in groups of size > 1 are duplicates
+        # (dropna=False keeps missing keys comparable, matching DataFrame.duplicated)
+        # string keys (object or Arrow-backed) are hashed as integer category codes
+        key_frame = pd.DataFrame(
+            {
+                column: data[column].astype("category")
+                if pd.api.types.is_string_dtype(data[column])
+                else data[column]
+                for column in self._key_columns
+            }
+        )
+        codes = (
+            key_frame.groupby(list(self._key_columns), sort=False, observed=True, dropna=False)
+            .ngroup()
+            .to_numpy()
+        )
+        duplicates = np.bincount(codes)[codes] > 1 if codes.size else codes.astype(bool)
+        # positions of duplicate rows; only the sampled head is ever taken from ``data``
+        duplicate_positions = np.flatnonzero(duplicates)
+        duplicate_count = int(duplicate_positions.size)
+        if duplicate_count == 0:
             return CheckResult(
                 name=self.name,
                 status=CheckStatus.OK,
@@ -35,10 +55,10 @@ class UniquenessCheck(DataCheck):
         return CheckResult(
             name=self.name,
             status=CheckStatus.FAIL,
-            summary=f"found {duplicate_rows.shape[0]} duplicate key rows",
+            summary=f"found {duplicate_count} duplicate key rows",
             details={
-                "duplicate_count": int(duplicate_rows.shape[0]),
-                "sample_rows": dataframe_to_records(duplicate_rows),
+                "duplicate_count": duplicate_count,
+                "sample_rows": dataframe_to_records(data.iloc[duplicate_positions[:5]]),
             },
         )
 
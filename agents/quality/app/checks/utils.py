@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+import math
 from typing import Any
 
 import pandas as pd
 
 
-def dataframe_to_records(frame: pd.DataFrame, limit: int = 5) -> list[dict[str, Any]]:
-    """Convert a dataframe slice into JSON-serialisable records."""
+SAMPLE_KEY_COLUMNS = frozenset({"flight_id", "start_time_utc", "region_code"})
+"""Columns identifying a sampled row; results are summarised by flight and region."""
 
-    serialisable = frame.head(limit).copy()
-    for column in serialisable.select_dtypes(include=["datetime", "datetimetz"]).columns:
-        series = serialisable[column]
-        if series.dt.tz is None:
-            series = series.dt.tz_localize("UTC")
-        serialisable[column] = series.dt.tz_convert("UTC").dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-    return serialisable.where(pd.notna(serialisable), None).to_dict(orient="records")
 
+def dataframe_to_records(frame: pd.DataFrame, limit: int = 5) -> list[dict[str, Any]]:
+    """Convert a dataframe slice into JSON-serialisable records."""
 
-__all__ = ["dataframe_to_records"]
+    head = frame.head(limit)
+    records = head.to_dict(orient="records")
+    # a direct dtype-kind test; ``select_dtypes`` resolves its include list on every call
+    datetime_columns = [column for column, dtype in head.dtypes.items() if dtype.kind == "M"]
+    for column in datetime_columns:
+        # one DatetimeIndex (a view for numpy datetimes) instead of repeated ``.dt`` dispatch;
+        # it also covers Arrow-backed timestamps, which have no DatetimeArray
+        values = pd.DatetimeIndex(head[column])
+        if values.tz is None:
+            values = values.tz_localize("UTC")
+        formatted = values.tz_convert("UTC").strftime("%Y-%m-%dT%H:%M:%SZ")
+        for record, value in zip(records, formatted):
+            record[column] = value
+    # at most ``limit`` rows, so replacing missing values in Python beats a frame-wide ``where``
+    for record in records:
+        for key, value in record.items():
+            if _is_missing(value):
+                record[key] = None
+    return records
+
+
+def _is_missing(value: Any) -> bool:
+    return value is pd.NA or value is pd.NaT or (isinstance(value, float) and math.isnan(value))
+
+
+__all__ = ["SAMPLE_KEY_COLUMNS", "dataframe_to_records"]
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import typer
 from psycopg.conninfo import make_conninfo
 
@@ -19,6 +19,9 @@ from .repository import QualityRepository
 app = typer.Typer(help="Quality validation utilities for normalized flights.")
 LOGGER = get_logger(__name__)
 
+# ``missing_months`` is keyed by int year; NumPy scalars may appear in check details
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 def _default_output_path(settings: QualitySettings, dataset_version: str | None) -> Path:
     suffix = dataset_version or datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
@@ -101,31 +104,32 @@ def validate(
     LOGGER.debug("Loaded settings", extra={"settings": settings.model_dump()})
 
     repository = QualityRepository(str(settings.database_url))
-    report: QualityReport = run_pipeline(
-        settings,
-        dataset_version,
-        repository=repository,
-        dry_run=dry_run,
-    )
+    try:
+        report: QualityReport = run_pipeline(
+            settings,
+            dataset_version,
+            repository=repository,
+            dry_run=dry_run,
+        )
+    finally:
+        repository.close()
     typer.echo(report.quality_status)
 
     output_path = output or _default_output_path(settings, report.dataset_version)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as fp:
-        json.dump(report.to_dict(), fp, indent=2, ensure_ascii=False)
+    output_path.write_bytes(report.to_json(_JSON_OPTIONS))
     violations_path = _violations_output_path(output_path)
-    with violations_path.open("w", encoding="utf-8") as fp:
-        json.dump(
+    violations_path.write_bytes(
+        orjson.dumps(
             {
                 "warn_count": report.warn_count,
                 "fail_count": report.fail_count,
                 "total": report.violation_count,
                 "quality_status": report.quality_status,
             },
-            fp,
-            indent=2,
-            ensure_ascii=False,
+            option=_JSON_OPTIONS,
         )
+    )
     LOGGER.info(
         "Artifacts written",
         extra={"report_path": str(output_path), "violations_path": str(violations_path)},
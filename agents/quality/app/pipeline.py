@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Iterable, Iterator
+from itertools import repeat
+from typing import Any, Callable, Iterable, Sequence
 
+import orjson
 import pandas as pd
-import psycopg
+import polars as pl
+import pyarrow as pa
+from adbc_driver_postgresql import dbapi as adbc
 
 from agents.ingest.app.schemas import CANONICAL_ORDER
 
 from .checks import CheckResult, CheckStatus, DataCheck, default_checks
+from .checks.coordinate_range import CoordinateRangeCheck, CoordinateRangeSummary
+from .checks.duration_range import DurationRangeCheck, DurationRangeSummary
+from .checks.utils import dataframe_to_records
 from .config import QualitySettings
 from .logging import get_logger
 from .repository import (
@@ -49,6 +59,40 @@ class QualityReport:
     def to_dict(self) -> dict[str, Any]:
         """Return a JSON serialisable representation."""
 
+        payload = self._header()
+        payload["checks"] = [
+            {
+                "name": check.name,
+                "status": check.status.value,
+                "summary": check.summary,
+                "details": check.details,
+            }
+            for check in self.checks
+        ]
+        payload["entries"] = self._entry_records()
+        payload["flight_issues"] = [
+            {
+                "flight_uid": issue.flight_uid,
+                "check_name": issue.check_name,
+                "severity": issue.severity.value,
+                "details": issue.details,
+            }
+            for issue in self.flight_issues
+        ]
+        return payload
+
+    def to_json(self, option: int = 0) -> bytes:
+        """Return the :meth:`to_dict` document encoded as JSON bytes by orjson."""
+
+        # orjson encodes dataclasses and str enums natively; check results and flight issues
+        # already have the report's field names and order, so no per-item dict is built for them
+        payload = self._header()
+        payload["checks"] = self.checks
+        payload["entries"] = self._entry_records()
+        payload["flight_issues"] = self.flight_issues
+        return orjson.dumps(payload, option=option)
+
+    def _header(self) -> dict[str, Any]:
         return {
             "dataset_version": self.dataset_version,
             "generated_at": self.generated_at.isoformat(),
@@ -56,34 +100,18 @@ class QualityReport:
             "quality_status": self.quality_status,
             "warn_count": self.warn_count,
             "fail_count": self.fail_count,
-            "checks": [
-                {
-                    "name": check.name,
-                    "status": check.status.value,
-                    "summary": check.summary,
-                    "details": check.details,
-                }
-                for check in self.checks
-            ],
-            "entries": [
-                {
-                    "check_name": entry.check_name,
-                    "severity": entry.severity.value,
-                    "details": entry.payload,
-                }
-                for entry in self.entries
-            ],
-            "flight_issues": [
-                {
-                    "flight_uid": issue.flight_uid,
-                    "check_name": issue.check_name,
-                    "severity": issue.severity.value,
-                    "details": issue.details,
-                }
-                for issue in self.flight_issues
-            ],
         }
 
+    def _entry_records(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "check_name": entry.check_name,
+                "severity": entry.severity.value,
+                "details": entry.payload,
+            }
+            for entry in self.entries
+        ]
+
     @property
     def violation_count(self) -> int:
         """Return the total number of WARN/FAIL checks."""
@@ -91,62 +119,179 @@ class QualityReport:
         return self.warn_count + self.fail_count
 
 
-def load_flights(settings: QualitySettings, dataset_version: str | None) -> pd.DataFrame:
-    """Load normalized flights from Postgres using psycopg."""
+def load_flights(
+    settings: QualitySettings,
+    dataset_version: str | None,
+    columns: Sequence[str] = CANONICAL_ORDER,
+) -> pd.DataFrame:
+    """Load normalized flights from Postgres as Arrow through the ADBC driver."""
 
-    query = [
-        "SELECT",
-        ", ".join(CANONICAL_ORDER),
-        f"FROM {settings.database_schema}.{settings.table_name}",
-    ]
+    source = [f"FROM {settings.database_schema}.{settings.table_name}"]
     params: list[Any] = []
     if dataset_version:
-        query.append("WHERE dataset_version = %s")
+        source.append("WHERE dataset_version = $1")
         params.append(dataset_version)
 
-    sql = " ".join(query)
+    sql = " ".join(["SELECT", ", ".join(columns), *source])
     LOGGER.info("Fetching flights from database", extra={"dataset_version": dataset_version})
-    with psycopg.connect(settings.database_url, autocommit=True) as conn:
-        frame = pd.read_sql(sql, conn, params=params or None)
+    with adbc.connect(str(settings.database_url), autocommit=True) as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params or None)
+            table = cur.fetch_arrow_table()
+    # columnar results skip per-value Python boxing; timestamps stay datetime64 for .dt access.
+    # self_destruct frees each converted Arrow column, so the table and frame never coexist
+    frame = table.to_pandas(types_mapper=_arrow_dtype, split_blocks=True, self_destruct=True)
+    del table
     LOGGER.info("Loaded %s records", len(frame))
     return frame
 
 
-def run_checks(data: pd.DataFrame, checks: Iterable[DataCheck]) -> list[CheckResult]:
-    """Run the provided checks against ``data``."""
+def _arrow_dtype(arrow_type: pa.DataType) -> pd.ArrowDtype | None:
+    """Map Arrow columns to Arrow-backed pandas dtypes, except timestamps."""
+
+    return None if pa.types.is_timestamp(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+RangeSummary = CoordinateRangeSummary | DurationRangeSummary
+
+
+def _fused_range_summaries(
+    data: pd.DataFrame, checks: list[DataCheck]
+) -> list[RangeSummary | None]:
+    """Evaluate every range check's predicate in one Polars pass over ``data``.
+
+    Returns one summary per check (``None`` for checks that scan the frame themselves).
+    """
+
+    summaries: list[RangeSummary | None] = [None] * len(checks)
+    predicates: dict[tuple[float, ...], pl.Expr] = {}
+    keys: dict[int, tuple[float, ...]] = {}
+    for index, check in enumerate(checks):
+        if isinstance(check, CoordinateRangeCheck):
+            if not _numeric_columns(data, "latitude", "longitude"):
+                continue
+            key: tuple[float, ...] = ()
+            lat, lon = pl.col("latitude"), pl.col("longitude")
+            predicate = (lat < -90) | (lat > 90) | (lon < -180) | (lon > 180)
+        elif isinstance(check, DurationRangeCheck):
+            if not _numeric_columns(data, "duration_minutes"):
+                continue
+            key = (check.minimum, check.maximum)
+            duration = pl.col("duration_minutes")
+            predicate = (duration < check.minimum) | (duration > check.maximum)
+        else:
+            continue
+        predicates.setdefault(key, predicate)
+        keys[index] = key
+    if not predicates:
+        return summaries
+
+    columns = sorted({name for mask in predicates.values() for name in mask.meta.root_names()})
+    names = {key: f"p{position}" for position, key in enumerate(predicates)}
+    # NaN becomes null in Polars, and null never satisfies a predicate
+    aggregates = (
+        pl.from_pandas(data[columns])
+        .lazy()
+        .select(
+            *(mask.sum().alias(f"{names[key]}_count") for key, mask in predicates.items()),
+            *(
+                pl.arg_where(mask).head(5).implode().alias(f"{names[key]}_rows")
+                for key, mask in predicates.items()
+            ),
+        )
+        .collect()
+        .row(0, named=True)
+    )
 
-    results: list[CheckResult] = []
-    for check in checks:
+    row_count = len(data)
+    for index, key in keys.items():
+        invalid_count = int(aggregates[f"{names[key]}_count"] or 0)
+        positions = aggregates[f"{names[key]}_rows"] or []
+        sample_rows = dataframe_to_records(data.iloc[positions]) if invalid_count else []
+        check = checks[index]
+        if isinstance(check, DurationRangeCheck):
+            summaries[index] = DurationRangeSummary(
+                minimum=check.minimum,
+                maximum=check.maximum,
+                row_count=row_count,
+                invalid_count=invalid_count,
+                sample_rows=sample_rows,
+            )
+        else:
+            summaries[index] = CoordinateRangeSummary(
+                row_count=row_count, invalid_count=invalid_count, sample_rows=sample_rows
+            )
+    return summaries
+
+
+def _numeric_columns(data: pd.DataFrame, *columns: str) -> bool:
+    return all(
+        column in data.columns and pd.api.types.is_numeric_dtype(data[column])
+        for column in columns
+    )
+
+
+def run_checks(data: pd.DataFrame, checks: Iterable[DataCheck]) -> list[CheckResult]:
+    """Run the provided checks against ``data``.
+
+    The range checks' predicates are evaluated up front in a single fused scan and each
+    result is handed to its check directly. Checks then run concurrently on a thread pool;
+    results keep the order of ``checks``.
+    """
+
+    active_checks = list(checks)
+    if not active_checks:
+        return []
+    summaries = _fused_range_summaries(data, active_checks)
+    # checks only read ``data``, so they run side by side; ``map`` keeps the input order
+    workers = min(len(active_checks), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quality-check") as executor:
+        return list(executor.map(_run_check, active_checks, summaries, repeat(data)))
+
+
+def _run_check(check: DataCheck, summary: RangeSummary | None, data: pd.DataFrame) -> CheckResult:
+    # checked per call rather than at import, since the CLI configures logging later;
+    # skipping the calls avoids building their ``extra`` dicts when DEBUG is off
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
         LOGGER.debug("Running check", extra={"check": check.name})
-        result = check.run(data)
-        results.append(result)
+    result = check.run(data) if summary is None else check.run(data, summary)
+    if debug:
         LOGGER.debug("Check result", extra={"check": check.name, "status": result.status.value})
-    return results
+    return result
 
 
 def aggregate_status(results: Iterable[CheckResult]) -> CheckStatus:
     """Aggregate individual check results into an overall status."""
 
-    final_status = CheckStatus.OK
-    for result in results:
-        if result.status is CheckStatus.FAIL:
-            return CheckStatus.FAIL
-        if result.status is CheckStatus.WARN and final_status is CheckStatus.OK:
-            final_status = CheckStatus.WARN
-    return final_status
+    statuses = {result.status for result in results}
+    if CheckStatus.FAIL in statuses:
+        return CheckStatus.FAIL
+    if CheckStatus.WARN in statuses:
+        return CheckStatus.WARN
+    return CheckStatus.OK
+
+
+_SAMPLE_KEYS = ("sample_rows", "rows", "violations")
+
+# enum members are not constants, so an inline set literal would be rebuilt per result
+_ISSUE_STATUSES = frozenset({CheckStatus.WARN, CheckStatus.FAIL})
 
 
-def _iter_sample_rows(details: dict[str, Any] | None) -> Iterator[dict[str, Any]]:
-    """Yield dict rows stored inside the ``details`` payload (if any)."""
+def _iter_sample_rows(details: dict[str, Any] | None) -> Sequence[dict[str, Any]]:
+    """Return the rows stored inside the ``details`` payload (if any).
+
+    Checks store their sample under a single key, as a list of dicts (see
+    :func:`~.checks.utils.dataframe_to_records`); the first list found is returned.
+    """
 
     if not details:
-        return
-    for key in ("sample_rows", "rows", "violations"):
+        return ()
+    for key in _SAMPLE_KEYS:
         value = details.get(key)
         if isinstance(value, list):
-            for row in value:
-                if isinstance(row, dict):
-                    yield row
+            return value
+    return ()
 
 
 def summarise_results(
@@ -162,13 +307,18 @@ def summarise_results(
         if details:
             payload["details"] = details
 
-        rows = list(_iter_sample_rows(details))
-        impacted_regions = sorted(
-            {str(row["region_code"]) for row in rows if row.get("region_code")}
-        )
-        impacted_records = sorted(
-            {str(row["flight_id"]) for row in rows if row.get("flight_id")}
-        )
+        # one pass over the sample rows collects regions and flights together
+        regions: set[str] = set()
+        records: set[str] = set()
+        for row in _iter_sample_rows(details):
+            region_code = row.get("region_code")
+            flight_id = row.get("flight_id")
+            if region_code:
+                regions.add(str(region_code))
+            if flight_id:
+                records.add(str(flight_id))
+        impacted_regions = sorted(regions)
+        impacted_records = sorted(records)
         if impacted_regions:
             payload["impacted_regions"] = impacted_regions
         if impacted_records:
@@ -181,11 +331,12 @@ def summarise_results(
                 payload=payload,
             )
         )
-        if result.status in {CheckStatus.WARN, CheckStatus.FAIL}:
+        if result.status in _ISSUE_STATUSES:
+            # one read-only payload per check, shared by all of its flight issues
+            issue_details: dict[str, Any] = {"summary": result.summary}
+            if details:
+                issue_details["details"] = details
             for flight_uid in impacted_records:
-                issue_details = {"summary": result.summary}
-                if details:
-                    issue_details["details"] = details
                 flight_issues.append(
                     FlightQualityIssue(
                         flight_uid=flight_uid,
@@ -197,6 +348,39 @@ def summarise_results(
     return entries, flight_issues
 
 
+def _projected_columns(checks: Iterable[DataCheck]) -> list[str]:
+    """Return the canonical columns ``checks`` read, in table order."""
+
+    needed: set[str] = set()
+    for check in checks:
+        # checks that do not declare their columns get the full table
+        columns = getattr(check, "required_columns", None) or {"*"}
+        if "*" in columns:
+            return list(CANONICAL_ORDER)
+        needed.update(columns)
+    return [column for column in CANONICAL_ORDER if column in needed] or list(CANONICAL_ORDER)
+
+
+def _parse_start_times(data: pd.DataFrame) -> pd.DataFrame:
+    """Return ``data`` with ``start_time_utc`` as UTC datetimes, parsed once for all checks.
+
+    The column is only replaced when every present value parses: otherwise the raw strings
+    are kept, so the schema check does not see coerced NaT as nulls and the monthly check
+    reports the offending input.
+    """
+
+    if "start_time_utc" not in data.columns or data["start_time_utc"].dtype.kind == "M":
+        return data
+    raw = data["start_time_utc"]
+    parsed = pd.to_datetime(raw, utc=True, errors="coerce", format="ISO8601")
+    if (parsed.isna() & raw.notna()).any():
+        return data
+    # a shallow copy, so the loader's frame keeps its original column
+    data = data.copy(deep=False)
+    data["start_time_utc"] = parsed
+    return data
+
+
 def run_pipeline(
     settings: QualitySettings,
     dataset_version: str | None = None,
@@ -209,15 +393,26 @@ def run_pipeline(
     """Execute the full validation flow."""
 
     dataset = dataset_version or settings.default_dataset_version
-    data_loader = loader or load_flights
     active_checks = list(checks or default_checks())
 
-    data = data_loader(settings, dataset)
+    if loader is None:
+        # the built-in loader selects only the columns the checks read
+        data = load_flights(settings, dataset, columns=_projected_columns(active_checks))
+    else:
+        data = loader(settings, dataset)
+    data = _parse_start_times(data)
     results = run_checks(data, active_checks)
-    status = aggregate_status(results)
+    # entry severities mirror the result statuses, so one pass yields the counts and status
+    warn_count = fail_count = 0
+    for result in results:
+        if result.status is CheckStatus.FAIL:
+            fail_count += 1
+        elif result.status is CheckStatus.WARN:
+            warn_count += 1
+    status = (
+        CheckStatus.FAIL if fail_count else CheckStatus.WARN if warn_count else CheckStatus.OK
+    )
     entries, flight_issues = summarise_results(results)
-    warn_count = sum(1 for entry in entries if entry.severity is CheckStatus.WARN)
-    fail_count = sum(1 for entry in entries if entry.severity is CheckStatus.FAIL)
     quality_status = QUALITY_STATUS_MAP[status]
 
     report = QualityReport(
@@ -243,7 +438,8 @@ def run_pipeline(
                 "quality_status": quality_status,
             },
         )
-        with repository.connection() as conn:
+        # pipeline mode queues the writes below and synchronises with the server once
+        with repository.connection() as conn, conn.pipeline():
             dataset_id = repository.fetch_dataset_version_id(conn, dataset)
             repository.replace_quality_reports(conn, dataset_id, entries)
             repository.replace_flight_quality_issues(conn, dataset_id, flight_issues)
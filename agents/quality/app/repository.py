@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Iterable, Iterator
 
-from psycopg import Connection, connect
-from psycopg.rows import dict_row
+from psycopg import Connection
 from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
 
 from .checks import CheckStatus
 
@@ -35,28 +36,66 @@ class FlightQualityIssue:
 
 @dataclass(slots=True)
 class QualityRepository:
-    """Provide high-level helpers for persisting quality results."""
+    """Provide high-level helpers for persisting quality results.
+
+    With ``fast_commit`` (the default) commits do not wait for the WAL flush: a crash may
+    lose the latest report, which the next validation run regenerates.
+    """
 
     database_url: str
+    fast_commit: bool = True
+    # connections whose open transaction already ran the quality column DDL
+    _quality_columns_checked: set[int] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    # set once that DDL has been committed, after which no connection needs it again
+    _quality_columns_ready: bool = field(default=False, init=False, repr=False, compare=False)
+    _pool: ConnectionPool | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_pool(self) -> ConnectionPool:
+        """Return the shared connection pool, opening it on first use."""
+
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                conninfo=self.database_url,
+                min_size=1,
+                max_size=4,
+                # batched inserts reuse a server-side prepared plan from their second row on,
+                # while the one-off statements of a run are never prepared
+                kwargs={"prepare_threshold": 1},
+                open=True,
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Close the connection pool, if one was opened."""
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     @contextmanager
     def connection(self) -> Iterator[Connection]:
-        """Yield a transactional psycopg connection."""
-
-        conn = connect(self.database_url)
-        try:
-            yield conn
-            conn.commit()
-        except Exception:  # pragma: no cover - defensive rollback
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Yield a transactional psycopg connection from the repository's pool."""
+
+        with self._get_pool().connection() as conn:
+            try:
+                if self.fast_commit:
+                    conn.execute("SET LOCAL synchronous_commit = off")
+                yield conn
+                conn.commit()
+                if id(conn) in self._quality_columns_checked:
+                    self._quality_columns_ready = True
+            except Exception:  # pragma: no cover - defensive rollback
+                conn.rollback()
+                raise
+            finally:
+                self._quality_columns_checked.discard(id(conn))
 
     def fetch_dataset_version_id(self, conn: Connection, version_name: str) -> int:
         """Return the primary key for ``dataset_version`` matching ``version_name``."""
 
-        with conn.cursor(row_factory=dict_row) as cur:
+        with conn.cursor() as cur:
             cur.execute(
                 """
                 SELECT id
@@ -69,7 +108,7 @@ class QualityRepository:
             if not row:
                 msg = f"dataset_version '{version_name}' not found"
                 raise ValueError(msg)
-            return int(row["id"])
+            return int(row[0])
 
     def replace_quality_reports(
         self,
@@ -79,51 +118,68 @@ class QualityRepository:
     ) -> None:
         """Replace existing rows in ``quality_report`` for the dataset version."""
 
+        rows = [
+            (
+                dataset_version_id,
+                entry.region_id,
+                entry.check_name,
+                entry.severity.value,
+                Jsonb(entry.payload),
+            )
+            for entry in entries
+        ]
         with conn.cursor() as cur:
+            # only rows of checks that no longer report are deleted; the rest are updated in
+            # place, which avoids rewriting (and leaving dead tuples for) every report row
             cur.execute(
                 """
                 DELETE FROM quality_report
                  WHERE dataset_version_id = %s
+                   AND check_name <> ALL(%s)
                 """,
-                (dataset_version_id,),
+                (dataset_version_id, [row[2] for row in rows]),
             )
-            for entry in entries:
-                cur.execute(
-                    """
-                    INSERT INTO quality_report (
-                        dataset_version_id,
-                        region_id,
-                        check_name,
-                        severity,
-                        details
-                    )
-                    VALUES (%s, %s, %s, %s, %s)
-                    """,
-                    (
-                        dataset_version_id,
-                        entry.region_id,
-                        entry.check_name,
-                        entry.severity.value,
-                        Jsonb(entry.payload),
-                    ),
+            # executemany pipelines the upserts instead of waiting on one round trip per row
+            cur.executemany(
+                """
+                INSERT INTO quality_report (
+                    dataset_version_id,
+                    region_id,
+                    check_name,
+                    severity,
+                    details
                 )
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (dataset_version_id, check_name) DO UPDATE
+                   SET region_id = EXCLUDED.region_id,
+                       severity = EXCLUDED.severity,
+                       details = EXCLUDED.details,
+                       created_at = NOW()
+                """,
+                rows,
+            )
 
     def _ensure_quality_columns(self, conn: Connection) -> None:
-        """Ensure auxiliary quality-related columns exist (idempotent)."""
+        """Ensure auxiliary quality-related columns exist (idempotent).
+
+        Migration ``0005`` creates the columns; this fallback for unmigrated databases runs
+        at most once per transaction and is skipped entirely once a transaction that ran it
+        has committed, since the ``ALTER TABLE`` locks ``dataset_version`` exclusively.
+        """
 
+        if self._quality_columns_ready or id(conn) in self._quality_columns_checked:
+            return
         with conn.cursor() as cur:
+            # serialise concurrent validators so only one of them alters the table
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext('quality_schema'))")
             cur.execute(
                 """
                 ALTER TABLE dataset_version
-                ADD COLUMN IF NOT EXISTS quality_warn_count INTEGER NOT NULL DEFAULT 0
-                """
-            )
-            cur.execute(
-                """
-                ALTER TABLE dataset_version
+                ADD COLUMN IF NOT EXISTS quality_warn_count INTEGER NOT NULL DEFAULT 0,
                 ADD COLUMN IF NOT EXISTS quality_fail_count INTEGER NOT NULL DEFAULT 0
                 """
             )
+        self._quality_columns_checked.add(id(conn))
 
     def update_dataset_version(
         self,
@@ -170,27 +226,39 @@ class QualityRepository:
     ) -> None:
         """Persist quality issues for flights belonging to ``dataset_version_id``."""
 
+        # issues of one check share a single details dict, so each is encoded to JSON once
+        encoded: dict[int, str] = {}
+        flight_uids: list[str] = []
+        check_names: list[str] = []
+        severities: list[str] = []
+        details: list[str] = []
+        for issue in issues:
+            payload = encoded.get(id(issue.details))
+            if payload is None:
+                payload = encoded[id(issue.details)] = json.dumps(issue.details)
+            flight_uids.append(issue.flight_uid)
+            check_names.append(issue.check_name)
+            severities.append(issue.severity.value)
+            details.append(payload)
+        if not flight_uids:
+            return
         with conn.cursor() as cur:
-            for issue in issues:
-                cur.execute(
-                    """
-                    INSERT INTO flight_quality_issues (
-                        dataset_version_id,
-                        flight_uid,
-                        check_name,
-                        severity,
-                        details
-                    )
-                    VALUES (%s, %s, %s, %s, %s)
-                    """,
-                    (
-                        dataset_version_id,
-                        issue.flight_uid,
-                        issue.check_name,
-                        issue.severity.value,
-                        Jsonb(issue.details),
-                    ),
+            # one statement sends each column as an array and the server unnests the rows
+            cur.execute(
+                """
+                INSERT INTO flight_quality_issues (
+                    dataset_version_id,
+                    flight_uid,
+                    check_name,
+                    severity,
+                    details
                 )
+                SELECT %s, issue.flight_uid, issue.check_name, issue.severity, issue.details
+                  FROM UNNEST(%s::text[], %s::text[], %s::text[], %s::jsonb[])
+                       AS issue(flight_uid, check_name, severity, details)
+                """,
+                (dataset_version_id, flight_uids, check_names, severities, details),
+            )
 
     def replace_flight_quality_issues(
         self,
@@ -208,7 +276,7 @@ class QualityRepository:
     ) -> list[FlightQualityIssue]:
         """Return persisted quality issues for a dataset version."""
 
-        with conn.cursor(row_factory=dict_row) as cur:
+        with conn.cursor() as cur:
             cur.execute(
                 """
                 SELECT flight_uid, check_name, severity, details
@@ -220,14 +288,13 @@ class QualityRepository:
             )
             rows = cur.fetchall() or []
         issues: list[FlightQualityIssue] = []
-        for row in rows:
-            payload = row["details"] if row["details"] is not None else {}
+        for flight_uid, check_name, severity, details in rows:
             issues.append(
                 FlightQualityIssue(
-                    flight_uid=row["flight_uid"],
-                    check_name=row["check_name"],
-                    severity=CheckStatus(row["severity"]),
-                    details=dict(payload),
+                    flight_uid=flight_uid,
+                    check_name=check_name,
+                    severity=CheckStatus(severity),
+                    details=dict(details) if details is not None else {},
                 )
             )
         return issues
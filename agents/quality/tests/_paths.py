@@ -0,0 +1,8 @@
+"""Filesystem locations shared by the quality test modules."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+SAMPLE_PATH = REPO_ROOT / "samples/rosaviation_sample.csv"
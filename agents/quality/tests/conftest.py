@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import sys
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from _paths import REPO_ROOT, SAMPLE_PATH
+
+# pytest imports this conftest before the test modules, which import the agents package
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from agents.ingest.app.schemas import CANONICAL_ORDER
+from agents.quality.app.pipeline import _arrow_dtype
+
+
+@pytest.fixture(scope="session")
+def sample_dataframe() -> pd.DataFrame:
+    """Canonical sample flights, parsed once per session.
+
+    The frame is shared between tests: tests that mutate it work on a copy.
+    Columns carry the same Arrow-backed dtypes as frames produced by ``load_flights``.
+    """
+
+    raw = pl.read_csv(SAMPLE_PATH, try_parse_dates=False).with_columns(
+        pl.col("start_time").str.to_datetime(time_zone="UTC").alias("start_time_utc"),
+        pl.col("end_time").str.to_datetime(time_zone="UTC").alias("end_time_utc"),
+        pl.col("duration_minutes").cast(pl.Float64),
+        pl.lit(None).alias("surrogate_id"),
+        pl.lit(False).alias("superseded"),
+    )
+    missing = [column for column in CANONICAL_ORDER if column not in raw.columns]
+    raw = raw.with_columns(pl.lit(None).alias(column) for column in missing)
+    return raw.select(CANONICAL_ORDER).to_arrow().to_pandas(types_mapper=_arrow_dtype)
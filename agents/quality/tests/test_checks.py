@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.quality.app.checks import CheckStatus, duration_outliers
+from agents.quality.app.checks.duration_range import DurationRangeCheck, DurationRangeSummary
+from agents.quality.app.checks.uniqueness import UniquenessCheck
+
+
+@pytest.mark.skipif(duration_outliers.njit is None, reason="numba not installed")
+def test_iqr_mask_numba_matches_numpy_including_nan() -> None:
+    values = np.array([np.nan, -5.0, 0.0, 10.0, 10.5, np.nan, 99.0, 100.0, np.inf, -np.inf])
+
+    jit_mask = duration_outliers._iqr_mask(values, 0.0, 10.5)
+    numpy_mask = (values < 0.0) | (values > 10.5)
+
+    assert jit_mask.dtype == np.bool_
+    np.testing.assert_array_equal(jit_mask, numpy_mask)
+    assert not jit_mask[np.isnan(values)].any()
+
+
+def test_duration_range_uses_summary_computed_for_the_frame() -> None:
+    data = pd.DataFrame({"duration_minutes": [30.0, 45.0]})
+    pushed_down = DurationRangeSummary(
+        minimum=1.0,
+        maximum=1440,
+        row_count=2,
+        invalid_count=1,
+        sample_rows=[{"flight_id": "X"}],
+    )
+
+    result = DurationRangeCheck().run(data, pushed_down)
+
+    assert result.status is CheckStatus.FAIL
+    assert result.details == {
+        "minimum": 1.0,
+        "maximum": 1440,
+        "invalid_count": 1,
+        "sample_rows": [{"flight_id": "X"}],
+    }
+
+
+def test_duration_range_rejects_summary_of_another_frame() -> None:
+    data = pd.DataFrame({"duration_minutes": [-5.0, 30.0, 45.0, 2000.0]})
+    summary = DurationRangeSummary(minimum=1.0, maximum=1440, row_count=len(data), invalid_count=2)
+    subset = data[data["duration_minutes"].between(10, 100)]
+
+    assert DurationRangeCheck().run(subset, summary).status is CheckStatus.OK
+    assert DurationRangeCheck(minimum=0.0).run(data, summary).details["invalid_count"] == 2
+
+
+def test_uniqueness_samples_duplicates_in_row_order() -> None:
+    data = pd.DataFrame(
+        {
+            "flight_id": [f"F{i % 4}" for i in range(12)],
+            "start_time_utc": ["2024-01-01T10:00:00Z"] * 12,
+            "region_code": ["RU-MOW"] * 11 + ["RU-SPE"],
+        },
+        index=range(100, 112),
+    )
+
+    result = UniquenessCheck().run(data)
+
+    assert result.status is CheckStatus.FAIL
+    assert result.details is not None
+    assert result.details["duplicate_count"] == 11
+    sampled = [row["flight_id"] for row in result.details["sample_rows"]]
+    assert sampled == ["F0", "F1", "F2", "F3", "F0"]
@@ -0,0 +1,9 @@
+-- 0003_region_boundary_index.sql
+-- Spatial index for point-in-region lookups against region boundaries
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_regions_boundary
+    ON regions USING GIST (boundary);
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- 0004_quality_report_check_unique.sql
+-- One quality_report row per check and dataset version, so results can be upserted
+
+BEGIN;
+
+-- keep the newest row of any earlier duplicates so the unique index can be built
+DELETE FROM quality_report AS older
+ USING quality_report AS newer
+ WHERE older.dataset_version_id = newer.dataset_version_id
+   AND older.check_name = newer.check_name
+   AND older.id < newer.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_quality_report_check
+    ON quality_report (dataset_version_id, check_name);
+
+COMMIT;
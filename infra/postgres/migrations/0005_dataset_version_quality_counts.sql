@@ -0,0 +1,10 @@
+-- 0005_dataset_version_quality_counts.sql
+-- WARN/FAIL check counts recorded by the quality agent
+
+BEGIN;
+
+ALTER TABLE dataset_version
+    ADD COLUMN IF NOT EXISTS quality_warn_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS quality_fail_count INTEGER NOT NULL DEFAULT 0;
+
+COMMIT;